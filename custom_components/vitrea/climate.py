@@ -102,7 +102,7 @@ class VitreaClimate(ClimateEntity):
     @property
     def temperature_unit(self) -> str:
         """Return the unit of measurement."""
-        if not self._thermostat.temperature_mode:
+        if self._thermostat.temperature_mode is None:
             return UnitOfTemperature.CELSIUS
         return self.TEMPERATURE_UNITS_MAPPING[self._thermostat.temperature_mode.value]
 
@@ -151,7 +151,7 @@ class VitreaClimate(ClimateEntity):
     @property
     def fan_mode(self) -> str:
         """Return the current fan mode."""
-        if not self._thermostat.fan_speed:
+        if self._thermostat.fan_speed is None:
             return None
         return self.FAN_SPEED_MAPPING.get(self._thermostat.fan_speed.value, None)
 
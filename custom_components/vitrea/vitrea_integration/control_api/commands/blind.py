@@ -25,6 +25,13 @@ class BlindLocationCommand(Command):
             node_id=self.node_id, key_id=self.key_id, location=self.location
         ).encode()
 
+    @classmethod
+    def bound_template(cls, node_id, key_id) -> bytes:
+        """Return the frame for a fixed key as bytes with a %03d location slot."""
+        return cls.TEMPLATE.replace("{location:03d}", "%03d").format(
+            node_id=node_id, key_id=key_id
+        ).encode()
+
     def validate(self):
         if not isinstance(self.node_id, int) or not 0 <= self.node_id <= 999:
             raise ValueError("Node ID must be an integer between 0 and 999.")
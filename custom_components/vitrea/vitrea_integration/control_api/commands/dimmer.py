@@ -18,6 +18,13 @@ class DimmerIntensityCommand(Command):
             intensity=self.intensity,
         ).encode()
 
+    @classmethod
+    def bound_template(cls, node_id, key_id, duration=0) -> bytes:
+        """Return the frame for a fixed key as bytes with a %03d intensity slot."""
+        return cls.TEMPLATE.replace("{intensity:03d}", "%03d").format(
+            node_id=node_id, key_id=key_id, duration=duration
+        ).encode()
+
     def validate(self):
         if not isinstance(self.node_id, int) or not 0 <= self.node_id <= 999:
             raise ValueError("Node ID must be an integer between 0 and 999.")
@@ -14,6 +14,13 @@ class ToggleOnCommand(Command):
             node_id=self.node_id, key_id=self.key_id, duration=self.duration
         ).encode()
 
+    @classmethod
+    def bound_template(cls, node_id, key_id) -> bytes:
+        """Return the frame for a fixed key as bytes with a %03d duration slot."""
+        return cls.TEMPLATE.replace("{duration:03d}", "%03d").format(
+            node_id=node_id, key_id=key_id
+        ).encode()
+
     def validate(self):
         if not isinstance(self.node_id, int) or not 0 <= self.node_id <= 999:
             raise ValueError("Node ID must be an integer between 0 and 999.")
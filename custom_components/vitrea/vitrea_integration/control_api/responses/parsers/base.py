@@ -9,7 +9,7 @@ class ResponseParser(ABC):
     """
 
     @abstractmethod
-    async def parse(self, response):
+    def parse(self, response):
         """
         Parse the given response string into a structured format.
 
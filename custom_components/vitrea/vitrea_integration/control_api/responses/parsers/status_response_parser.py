@@ -41,7 +41,7 @@ class StatusResponseParser(ResponseParser):
         - Nxxx is the node number.
         - K is the key number (1-8 for nodes).
         - S is the status of the switch.
-        - PP...P is the parameter of the command.
+        - PP...P is the parameter of the command (an int when numeric).
         - <CR><LF> is the Carriage Return and Line Feed.
 
         :param response: The raw response string from the VBox.
@@ -57,6 +57,10 @@ class StatusResponseParser(ResponseParser):
             key = int(parts[2])
             status_code = parts[3]
             params = parts[4] if len(parts) > 4 else None
+            # Numeric parameters (intensity, location, countdown...) are
+            # decoded once here so the device models can assign them directly
+            if params is not None and params.isdigit():
+                params = int(params)
 
             node_status = {
                 "type": "node_status",
@@ -6,6 +6,9 @@ from ..control_api.commands import (
 )
 from ..vbox_controller import VBoxController
 from ..utils.enums import KeyTypes
+import logging
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class Blind(BaseDevice):
@@ -32,6 +35,7 @@ class Blind(BaseDevice):
         self._location = initial_location
         self.is_opening = False
         self.is_closing = False
+        self._location_frame = BlindLocationCommand.bound_template(node_id, key_id)
 
     @property
     def is_closed(self) -> bool:
@@ -55,11 +59,7 @@ class Blind(BaseDevice):
         """Set the location of the blind."""
         if not 0 <= location <= 100:
             raise ValueError("Location must be between 0 and 100")
-        await self.controller.connection.send(
-            BlindLocationCommand(
-                node_id=self.node_id, key_id=self.key_id, location=location
-            ).serialize()
-        )
+        await self.controller.connection.send(self._location_frame % location)
         if self.location < location:
             self.is_opening = True
         else:
@@ -79,9 +79,7 @@ class Blind(BaseDevice):
     async def blind_up(self) -> bool:
         """Move the blind up."""
         success = await self.controller.connection.send(
-            BlindLocationCommand(
-                node_id=self.node_id, key_id=self.key_id, location=100
-            ).serialize()
+            self._location_frame % 100
         )
         if success:
             self.is_opening = True
@@ -90,9 +88,7 @@ class Blind(BaseDevice):
     async def blind_down(self) -> bool:
         """Move the blind down."""
         success = await self.controller.connection.send(
-            BlindLocationCommand(
-                node_id=self.node_id, key_id=self.key_id, location=0
-            ).serialize()
+            self._location_frame % 0
         )
         if success:
             self.is_closing = True
@@ -106,6 +102,9 @@ class Blind(BaseDevice):
 
     async def update_state(self, data):
         """Update the state of the cover."""
-        location = int(data.get("parameters"))
-        self.location = location
+        location = data.get("parameters")
+        if isinstance(location, int):
+            self.location = location
+        elif location is not None:
+            _LOGGER.debug("Ignoring non-numeric location %r for %s", location, self._id)
         await self.publish_updates()
@@ -5,6 +5,13 @@ from ..utils.enums import KeyTypes
 from .base import BaseDevice
 # Validate Duration, supported key types and state
 
+# Maps the raw DND status parameter to (dnd, mur)
+_DND_FROM_INT = {
+    DNDStatus.OFF.value: (False, False),
+    DNDStatus.DND.value: (True, False),
+    DNDStatus.MUR.value: (False, True),
+}
+
 
 class DNDKeypad(BaseDevice):
     supported_key_types = [
@@ -46,7 +53,7 @@ class DNDKeypad(BaseDevice):
         return self._mur
 
     async def set_status(self, status: DNDStatus) -> bool:
-        if not isinstance(status, DNDStatus):
+        if type(status) is not DNDStatus:
             raise ValueError("Status must be an instance of DNDStatus.")
         await self.controller.connection.send(
             DNDSetStatus(node_id=self.node_id, status=status).serialize()
@@ -61,18 +68,7 @@ class DNDKeypad(BaseDevice):
 
     async def update_state(self, data):
         """Update the state of the switch."""
-        dnd_status = DNDStatus(int(data.get("params", "9")))
-        match dnd_status:
-            case DNDStatus.OFF:
-                self._dnd = False
-                self._mur = False
-            case DNDStatus.DND:
-                self._dnd = True
-                self._mur = False
-            case DNDStatus.MUR:
-                self._dnd = False
-                self._mur = True
-            case _:
-                self._dnd = False
-                self._mur = False
+        self._dnd, self._mur = _DND_FROM_INT.get(
+            data.get("parameters"), (False, False)
+        )
         await self.publish_updates()
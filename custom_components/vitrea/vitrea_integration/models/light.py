@@ -35,22 +35,15 @@ class Dimmer(BaseDevice):
         )
         self.key_id = key_id
         self._state = initial_state
-        self._intensity = initial_intensity
+        self.intensity = initial_intensity
+        self._intensity_frame = DimmerIntensityCommand.bound_template(
+            node_id, key_id
+        )
 
     @property
     def state(self) -> bool:
         return self._state
 
-    @property
-    def intensity(self) -> int:
-        return self._intensity
-
-    @intensity.setter
-    def intensity(self, value: int):
-        if not 0 <= value <= 100:
-            raise ValueError("Intensity must be between 0 and 100")
-        self._intensity = value
-
     @property
     def is_on(self) -> bool:
         """Return the state of the light."""
@@ -63,11 +56,7 @@ class Dimmer(BaseDevice):
         """Set the intensity of the light."""
         if not 0 <= intensity <= 100:
             raise ValueError("Intensity must be between 0 and 100")
-        await self.controller.connection.send(
-            DimmerIntensityCommand(
-                node_id=self.node_id, key_id=self.key_id, intensity=intensity
-            ).serialize()
-        )
+        await self.controller.connection.send(self._intensity_frame % intensity)
         return True
 
     async def stop(self) -> bool:
@@ -88,11 +77,7 @@ class Dimmer(BaseDevice):
 
     async def turn_off(self) -> bool:
         """Turn off the light."""
-        await self.controller.connection.send(
-            DimmerIntensityCommand(
-                node_id=self.node_id, key_id=self.key_id, intensity=0
-            ).serialize()
-        )
+        await self.controller.connection.send(self._intensity_frame % 0)
         return True
 
     async def get_state(self):
@@ -103,6 +88,9 @@ class Dimmer(BaseDevice):
 
     async def update_state(self, data):
         """Update the state of the light."""
-        intensity = int(data.get("parameters"))
-        self.intensity = intensity
+        intensity = data.get("parameters")
+        if isinstance(intensity, int):
+            self.intensity = intensity
+        elif intensity is not None:
+            _LOGGER.debug("Ignoring non-numeric intensity %r for %s", intensity, self._id)
         await self.publish_updates()
@@ -9,10 +9,11 @@ _LOGGER = logging.getLogger(__name__)
 
 class Satellite(BaseDevice):
     supported_key_types = [KeyTypes.Satellite.value]
-    _VITREA_TO_HASS_MAPPING = {
-        "satellite_key_short": "Short",
-        "satellite_key_long": "Long",
-        "satellite_key_release": "Release",
+    # sub_type -> (native_value, release after a short press)
+    _VITREA_EVENTS = {
+        "satellite_key_short": ("Short", True),
+        "satellite_key_long": ("Long", False),
+        "satellite_key_release": ("Release", False),
     }
 
     def __init__(
@@ -40,12 +41,12 @@ class Satellite(BaseDevice):
         pass
 
     async def update_state(self, data):
-        event_data = self._VITREA_TO_HASS_MAPPING.get(data["sub_type"])
-        if event_data is None:
+        entry = self._VITREA_EVENTS.get(data["sub_type"])
+        if entry is None:
             return
-        self.native_value = event_data
+        self.native_value, release = entry
         await self.publish_updates()
-        if event_data == "Short":
+        if release:
             await asyncio.sleep(1)
             self.native_value = "Release"
             await self.publish_updates()
@@ -1,3 +1,4 @@
+import sys
 from typing import Callable
 from ..control_api.commands import ScenarioCommand
 from ..vbox_controller import VBoxController
@@ -19,14 +20,17 @@ class Scenario:
         **kwargs,
     ):
         self.scene_id = scene_id
-        self.scene_name = scene_name
-        self.room_name = room_name
+        self.scene_name = sys.intern(scene_name)
+        self.room_name = sys.intern(room_name)
         self.controller = controller
         self._callbacks = set()
-        if append_room_to_name:
-            self.name = f"{room_name} {scene_name}"
-        else:
-            self.name = scene_name
+        self._append_room = append_room_to_name
+
+    @property
+    def name(self) -> str:
+        if self._append_room:
+            return f"{self.room_name} {self.scene_name}"
+        return self.scene_name
 
     @property
     def _id(self):
@@ -86,6 +86,7 @@ class Thermostat(BaseDevice):
         self.fan_speed = None
         self.operation_mode = None
         self.measured_temperature = None
+        self._temperature_range = (15, 90)
         if thermostat_type == AirConditionerType.TMSF:
             self.relay_state = None
 
@@ -132,18 +133,15 @@ class Thermostat(BaseDevice):
 
     @property
     def temperature_range(self) -> tuple:
-        if self.temperature_mode:
-            if self.temperature_mode.value == ThermostatTemperatureModes.CELSIUS.value:
-                return (15, 30)
-            elif (
-                self.temperature_mode.value
-                == ThermostatTemperatureModes.FAHRENHEIT.value
-            ):
-                return (60, 90)
-        return (15, 90)
+        return self._temperature_range
 
     async def _turn_on(self) -> bool:
-        if self.operation_mode and self.fan_speed and self.temperature_mode and self.set_temperature:
+        if (
+            self.operation_mode is not None
+            and self.fan_speed is not None
+            and self.temperature_mode is not None
+            and self.set_temperature is not None
+        ):
             params = ThermostatParams(
                 full_command=True,
                 mode=self.operation_mode,
@@ -177,28 +175,30 @@ class Thermostat(BaseDevice):
         if params_count_with_values == 0:
             return await self._turn_on()
         elif params_count_with_values == 1:
-            if mode:
+            if mode is not None:
                 mode = ThermostatModes(mode.value)
                 params = ThermostatParams(full_command=False, mode=mode)
-            elif fan_speed:
+            elif fan_speed is not None:
                 fan_speed = ThermostatFanSpeeds(fan_speed.value)
                 params = ThermostatParams(full_command=False, fan_speed=fan_speed)
-            elif temperature_mode:
+            elif temperature_mode is not None:
                 temperature_mode = ThermostatTemperatureModes(temperature_mode.value)
                 params = ThermostatParams(
                     full_command=False, temperature_mode=temperature_mode
                 )
-            elif temperature:
+            elif temperature is not None:
                 params = ThermostatParams(full_command=False, temperature=temperature)
         elif params_count_with_values > 1:
             params = ThermostatParams(
                 full_command=True,
-                mode=mode if mode else self.operation_mode,
-                fan_speed=fan_speed if fan_speed else self.fan_speed,
+                mode=mode if mode is not None else self.operation_mode,
+                fan_speed=fan_speed if fan_speed is not None else self.fan_speed,
                 temperature_mode=temperature_mode
-                if temperature_mode
+                if temperature_mode is not None
                 else self.temperature_mode,
-                temperature=temperature if temperature else self.set_temperature,
+                temperature=temperature
+                if temperature is not None
+                else self.set_temperature,
             )
         if not params:
             return False
@@ -249,6 +249,12 @@ class Thermostat(BaseDevice):
         self.set_temperature = params.get("set_temperature")
         self.measured_temperature = params.get("measured_temperature")
         self.temperature_mode = params.get("temperature_mode")
+        if self.temperature_mode == ThermostatTemperatureModes.CELSIUS:
+            self._temperature_range = (15, 30)
+        elif self.temperature_mode == ThermostatTemperatureModes.FAHRENHEIT:
+            self._temperature_range = (60, 90)
+        else:
+            self._temperature_range = (15, 90)
         if self.thermostat_type == AirConditionerType.TMSF:
             self.relay_state = params.get("relay_state")
         await self.publish_updates()
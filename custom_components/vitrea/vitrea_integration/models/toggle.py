@@ -9,6 +9,10 @@ from ..vbox_controller import VBoxController
 from ..utils.enums import KeyTypes
 
 from .base import BaseDevice
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
 # Validate Duration, supported key types and state
 
 
@@ -39,6 +43,7 @@ class Toggle(BaseDevice):
         self.key_id = key_id
         self._state = initial_state
         self._countdown_minutes = 0
+        self._on_frame = ToggleOnCommand.bound_template(node_id, key_id)
 
     @property
     def state(self) -> bool:
@@ -47,11 +52,7 @@ class Toggle(BaseDevice):
     async def turn_on(self, duration: int = 0) -> bool:
         if not 0 <= duration <= 120:
             raise ValueError("Duration must be between 0 and 120")
-        await self.controller.connection.send(
-            ToggleOnCommand(
-                node_id=self.node_id, key_id=self.key_id, duration=duration
-            ).serialize()
-        )
+        await self.controller.connection.send(self._on_frame % duration)
         return True
 
     async def turn_off(self) -> bool:
@@ -89,6 +90,8 @@ class Toggle(BaseDevice):
         """Update the state of the switch."""
         self.is_on = data.get("status")
         countdown = data.get("parameters")
-        if countdown is not None:
-            self._countdown_minutes = int(countdown)
+        if isinstance(countdown, int):
+            self._countdown_minutes = countdown
+        elif countdown is not None:
+            _LOGGER.debug("Ignoring non-numeric countdown %r for %s", countdown, self._id)
         await self.publish_updates()
@@ -4,10 +4,34 @@ from .floors import GetFloorNumbers, GetFloorParams
 from .keys import GetKeypadNumbers, GetKeyParams
 from .rooms import GetRoomNumbers, GetRoomParams
 from .scenarios import GetScenarioNumbers, GetScenarioParams
+import asyncio
+import contextlib
 import logging
+from collections import defaultdict
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on parameter requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+# Upper bound on queued frames joined into a single write
+MAX_WRITE_BATCH = 16
+
+RESPONSE_DISPATCH = {
+    cls.COMMAND_NUMBER.value: cls
+    for cls in (
+        GetFloorNumbers,
+        GetFloorParams,
+        GetRoomNumbers,
+        GetRoomParams,
+        GetKeypadNumbers,
+        GetKeyParams,
+        GetACNumbers,
+        GetACParams,
+        GetScenarioNumbers,
+        GetScenarioParams,
+    )
+}
+
 
 class VitreaDatabaseReader:
     RESPONSE_CALLBACK_MAP = {
@@ -24,8 +48,9 @@ class VitreaDatabaseReader:
     }
 
     def __init__(self, write):
-        self.writer = write
-        self.reader = self.check_for_response
+        self._write = write
+        self.writer = self.write_frame
+        self.reader = self.wait_for_response
         self.data = None
         self.floors = {}
         self.rooms = {}
@@ -33,8 +58,36 @@ class VitreaDatabaseReader:
         self.acs = {}
         self.scenarios = {}
         self.response_callbacks = self.RESPONSE_CALLBACK_MAP
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._waiters = {}
+        self._send_queue = asyncio.Queue()
+        self._writer_task = None
+
+    async def write_frame(self, frame: bytes):
+        # A single writer task owns the link, so frames never interleave
+        self._send_queue.put_nowait(frame)
+
+    async def _writer_loop(self):
+        while True:
+            frames = [await self._send_queue.get()]
+            while len(frames) < MAX_WRITE_BATCH and not self._send_queue.empty():
+                frames.append(self._send_queue.get_nowait())
+            try:
+                await self._write(b"".join(frames))
+            except Exception as e:
+                # The requests time out and retry on their own
+                _LOGGER.error("Error writing parameter requests: %s", e)
 
-    async def check_for_response(self, command_type: str, obj_id: int = None):
+    async def _bounded(self, command):
+        async with self._request_semaphore:
+            return await command.get_data(reader=self.reader, writer=self.writer)
+
+    async def _bounded_key(self, keypad, key_id):
+        # Keys are requested one by one, so each key holds its own permit rather than its keypad
+        async with self._request_semaphore:
+            return await keypad.get_key(self.reader, self.writer, key_id)
+
+    def check_for_response(self, command_type: str, obj_id: int = None):
         if command_type in self.response_callbacks:
             if isinstance(self.response_callbacks[command_type], dict):
                 if not obj_id:
@@ -44,16 +97,31 @@ class VitreaDatabaseReader:
                 return self.response_callbacks.pop(command_type, None)
         return False
 
+    async def wait_for_response(self, command_type: CommandNumber, obj_id: int = None):
+        result = self.check_for_response(command_type, obj_id)
+        if result:
+            return result
+        key = (command_type, obj_id)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[key] = waiter
+        try:
+            return await waiter
+        finally:
+            if self._waiters.get(key) is waiter:
+                del self._waiters[key]
+
+    def _wake_waiter(self, command_type: CommandNumber, obj_id: int = None):
+        waiter = self._waiters.pop((command_type, obj_id), None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(self.check_for_response(command_type, obj_id))
+
     async def get_floors(self):
         floor_ids = await GetFloorNumbers().get_data(
             reader=self.reader, writer=self.writer
         )
-        all_floors = [
-            await GetFloorParams(floor_id=floor_id).get_data(
-                reader=self.reader, writer=self.writer
-            )
-            for floor_id in floor_ids
-        ]
+        all_floors = await asyncio.gather(
+            *(self._bounded(GetFloorParams(floor_id=floor_id)) for floor_id in floor_ids)
+        )
         for floor in all_floors:
             self.floors[floor.get("id")] = floor
         return all_floors
@@ -62,12 +130,9 @@ class VitreaDatabaseReader:
         room_ids = await GetRoomNumbers().get_data(
             reader=self.reader, writer=self.writer
         )
-        all_rooms = [
-            await GetRoomParams(room_id=room_id).get_data(
-                reader=self.reader, writer=self.writer
-            )
-            for room_id in room_ids
-        ]
+        all_rooms = await asyncio.gather(
+            *(self._bounded(GetRoomParams(room_id=room_id)) for room_id in room_ids)
+        )
         for room in all_rooms:
             self.rooms[room.get("id")] = room
         return all_rooms
@@ -76,11 +141,26 @@ class VitreaDatabaseReader:
         keypads_info = await GetKeypadNumbers().get_data(
             reader=self.reader, writer=self.writer
         )
+        keypads = [
+            GetKeyParams(
+                keypad_id=keypad_info["id"],
+                number_of_keys=keypad_info["no_of_keys"],
+            )
+            for keypad_info in keypads_info
+        ]
+        keypads_data = await asyncio.gather(
+            *(
+                asyncio.gather(
+                    *(
+                        self._bounded_key(keypad, key_id)
+                        for key_id in range(1, keypad.number_of_keys + 1)
+                    )
+                )
+                for keypad in keypads
+            )
+        )
         all_keys = []
-        for keypad_info in keypads_info:
-            keypad_data = await GetKeyParams(
-                keypad_id=keypad_info["id"], number_of_keys=keypad_info["no_of_keys"]
-            ).get_data(reader=self.reader, writer=self.writer)
+        for keypad_info, keypad_data in zip(keypads_info, keypads_data):
             all_keys.extend(keypad_data)
             self.keypads[f"N{format(keypad_info['id'], '03')}"] = {
                 "keys": keypad_data,
@@ -90,12 +170,10 @@ class VitreaDatabaseReader:
 
     async def get_acs(self):
         ac_ids = await GetACNumbers().get_data(reader=self.reader, writer=self.writer)
-        all_acs = []
-        for ac_id in ac_ids:
-            ac_params = await GetACParams(ac_id=ac_id).get_data(
-                reader=self.reader, writer=self.writer
-            )
-            all_acs.append(ac_params)
+        all_acs = await asyncio.gather(
+            *(self._bounded(GetACParams(ac_id=ac_id)) for ac_id in ac_ids)
+        )
+        for ac_id, ac_params in zip(ac_ids, all_acs):
             self.acs[f"A{format(ac_id, '03')}"] = ac_params
         return all_acs
 
@@ -103,64 +181,22 @@ class VitreaDatabaseReader:
         scenario_ids = await GetScenarioNumbers().get_data(
             reader=self.reader, writer=self.writer
         )
-        all_scenarios = []
-        for scenario_id in scenario_ids:
-            scenario_params = await GetScenarioParams(scenario_id=scenario_id).get_data(
-                reader=self.reader, writer=self.writer
+        all_scenarios = await asyncio.gather(
+            *(
+                self._bounded(GetScenarioParams(scenario_id=scenario_id))
+                for scenario_id in scenario_ids
             )
-            all_scenarios.append(scenario_params)
+        )
+        for scenario_id, scenario_params in zip(scenario_ids, all_scenarios):
             self.scenarios[f"S{format(scenario_id, '03')}"] = scenario_params
         return all_scenarios
 
     async def response_callback(self, response):
-        response_identifier = response.hex()[8:10]
-        obj_id = int(response.hex()[14:18], 16)
-        bytes_response = int.from_bytes(
-                    response, byteorder="big"
-                )
-        match response_identifier:
-            case "01":
-                self.response_callbacks[CommandNumber.GetFloorNumbers] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case "02":
-                self.response_callbacks[CommandNumber.GetFloorParams][obj_id] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case "03":
-                self.response_callbacks[CommandNumber.GetRoomNumbers] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case "04":
-                self.response_callbacks[CommandNumber.GetRoomParams][obj_id] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case "05":
-                self.response_callbacks[
-                    CommandNumber.GetKeypadNumbers
-                ] = int.from_bytes(response, byteorder="big")
-            case "06":
-                self.response_callbacks[CommandNumber.GetKeyParams][obj_id] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case "07":
-                self.response_callbacks[CommandNumber.GetACNumbers] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case "08":
-                self.response_callbacks[CommandNumber.GetACParams][obj_id] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case "09":
-                self.response_callbacks[CommandNumber.GetSceneNumbers] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case "0a":
-                self.response_callbacks[CommandNumber.GetSceneParams][obj_id] = int.from_bytes(
-                    response, byteorder="big"
-                )
-            case _:
-                raise ValueError("Invalid response identifier")
+        reader_class = RESPONSE_DISPATCH.get(response[4])
+        if reader_class is None:
+            raise ValueError("Invalid response identifier")
+        obj_id = reader_class.store_response(self.response_callbacks, bytes(response))
+        self._wake_waiter(reader_class.COMMAND_NUMBER, obj_id)
 
     async def read_vitrea_controller(self):
         # Running all the fetchers async
@@ -171,8 +207,20 @@ class VitreaDatabaseReader:
             self.get_acs,
             self.get_scenarios,
         ]
-        for fetcher in fetchers:
-            await self._safe_read_controller(fetcher)
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        # Each stage waits on its own command number, so they can share the link
+        stages = [asyncio.create_task(self._safe_read_controller(f)) for f in fetchers]
+        try:
+            await asyncio.gather(*stages)
+        finally:
+            # A failed stage must not leave its siblings queueing frames the writer will never send
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            self._writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer_task
+            self._writer_task = None
 
     async def _safe_read_controller(self, func):
         success = False
@@ -187,38 +235,30 @@ class VitreaDatabaseReader:
             raise ValueError("Error reading Vitrea DB - Too many attempts")
 
     async def serialize(self):
+        keys_by_room = defaultdict(list)
+        for keypad in self.keypads.values():
+            for key in keypad.get("keys"):
+                keys_by_room[key.get("room_id")].append(key)
+        acs_by_room = defaultdict(list)
+        for ac in self.acs.values():
+            acs_by_room[ac.get("room_id")].append(ac)
+        scenarios_by_room = defaultdict(list)
+        for scenario in self.scenarios.values():
+            scenarios_by_room[scenario.get("room_id")].append(scenario)
+        rooms_by_floor = defaultdict(list)
+        for room in self.rooms.values():
+            rooms_by_floor[room.get("floor_id")].append(room)
+
         data = {"floors": [], "scenarios": []}
         for floor_id, floor in self.floors.items():
-            floor_rooms = [
-                room for room in self.rooms.values() if room.get("floor_id") == floor_id
-            ]
             floor_data = {**floor, "rooms": []}
-            for room in floor_rooms:
+            for room in rooms_by_floor.get(floor_id, []):
+                room_id = room.get("id")
                 _room = {**room}
-                _room["keys"] = []
-                for keypad in self.keypads.values():
-                    _room["keys"].extend(
-                        [
-                            key
-                            for key in keypad.get("keys")
-                            if key.get("room_id") == room.get("id")
-                        ]
-                    )
-                _room["acs"] = [
-                    ac
-                    for ac in self.acs.values()
-                    if ac.get("room_id") == room.get("id")
-                ]
-                _room["scenarios"] = [
-                    scenario
-                    for scenario in self.scenarios.values()
-                    if scenario.get("room_id") == room.get("id")
-                ]
+                _room["keys"] = keys_by_room.get(room_id, [])
+                _room["acs"] = acs_by_room.get(room_id, [])
+                _room["scenarios"] = scenarios_by_room.get(room_id, [])
                 floor_data["rooms"].append(_room)
             data["floors"].append(floor_data)
-        data["scenarios"] = [
-            scenario
-            for scenario in self.scenarios.values()
-            if scenario.get("room_id") == 65535
-        ]
+        data["scenarios"] = scenarios_by_room.get(65535, [])
         return data
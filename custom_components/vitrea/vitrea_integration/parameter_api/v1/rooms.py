@@ -1,66 +1,56 @@
-from .base import ParameterReader, CommandNumber
+from .base import ParameterReader, CommandNumber, build_param_command
 
 class GetRoomNumbers(ParameterReader):
     COMMAND_NUMBER = CommandNumber.GetRoomNumbers
 
     def __init__(self, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
-        self.command_data = ""
-        self.command_str = ""
         self.rooms = None
 
-    async def generate_command(self) -> str:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=1)
-        self.command_str += chr(0) # Group Number = 0 - not used feature in the protocol.
-        await self.add_checksum()
-        return self.command_str
+    def generate_command(self) -> bytes:
+        # Group Number = 0 - not used feature in the protocol.
+        return build_param_command(self.command_value, b"\x00")
     
     async def get_data(self, reader, writer) -> list:
-        if not self.command_str:
-            await self.generate_command()
-        response = await self.fetch_data_from_controller(reader, writer)
-        await self.parse_response(response)
+        command = self.generate_command()
+        response = await self.fetch_data_from_controller(reader, writer, command)
+        self.parse_response(response)
         if not self.response_parser:
             raise ValueError("No response received")
-        response_dict = self.response_parser.response_dict
-        self.number_of_rooms = response_dict["raw_data"].pop(0)
-        self.rooms_list = await self.response_parser.combine_bytes_to_words(response_dict["raw_data"])
+        raw_data = self.response_parser.response_dict["raw_data"]
+        self.number_of_rooms = raw_data[0]
+        self.rooms_list = self.response_parser.combine_bytes_to_words(raw_data[1:])
         return self.rooms_list
 
 class GetRoomParams(ParameterReader):
     COMMAND_NUMBER = CommandNumber.GetRoomParams
+    OBJECT_ID_LENGTH = 2
 
     def __init__(self, room_id, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.room_id = room_id
         self.floor_id = None
-        self.command_data = ""
-        self.command_str = ""
         self.floor_data = None
 
-    async def generate_command(self) -> str:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=2)
-        self.command_str += await self._int_to_hex_word(self.room_id)
-        await self.add_checksum()
-        return self.command_str
+    def generate_command(self) -> bytes:
+        return build_param_command(
+            self.command_value, self._int_to_hex_word(self.room_id)
+        )
     
     async def get_data(self, reader, writer) -> list:
-        if not self.command_str:
-            await self.generate_command()
-        response = await self.fetch_data_from_controller(reader, writer, obj_id=self.room_id)
-        await self.parse_response(response)
+        command = self.generate_command()
+        response = await self.fetch_data_from_controller(reader, writer, command, obj_id=self.room_id)
+        self.parse_response(response)
         if not self.response_parser:
             raise ValueError("No response received")
-        response_dict = self.response_parser.response_dict
-        room_id = await self._byte_list_to_hex(response_dict["raw_data"][:2])
-        floor_id = await self._byte_list_to_hex(response_dict["raw_data"][2:4])
+        raw_data = self.response_parser.response_dict["raw_data"]
+        room_id = self._byte_list_to_hex(raw_data[:2])
+        floor_id = self._byte_list_to_hex(raw_data[2:4])
         if not room_id == self.room_id:
             raise ValueError("Room ID mismatch")
-        name_len = response_dict["raw_data"][4]
-        name_data = response_dict["raw_data"][5:]
-        room_name = await self.response_parser.byte_list_to_string(name_data)
-        if not name_len / 2 == len(room_name):
+        name_len = raw_data[4]
+        name_data = raw_data[5:]
+        room_name = self.response_parser.byte_list_to_string(name_data)
+        if not name_len == 2 * len(room_name):
             raise ValueError("Floor name length mismatch")
         return {"id": room_id, "name": room_name, 'floor_id': floor_id, "keys": {}, "acs": {}}
\ No newline at end of file
@@ -7,6 +7,7 @@ from .commands.acs import GetACNumbers
 from .commands.scenarios import GetScenarioNumbers
 from .commands.base import BaseParameterCommandGenerator
 from .responses.parser import DBResponseParserFactory
+from .responses.base import RESULT_META, RESULT_MODELS, RESULT_KEY_MODELS
 import logging
 from ...models.database import (
     VitreaDatabaseModel,
@@ -18,10 +19,18 @@ from ...models.database import (
     ScenarioModel,
     BaseVitreaModel,
 )
-import datetime
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parser result keys that map directly onto VitreaDatabaseModel attributes
+_DB_FIELD_SETTERS = {
+    "no_of_floors": "no_of_floors",
+    "no_of_rooms": "no_of_rooms",
+    "no_of_keys": "no_of_keys",
+    "no_of_acs": "no_of_acs",
+    "no_of_scenarios": "no_of_scenarios",
+}
+
 
 class VitreaDatabaseReader:
     """
@@ -37,14 +46,29 @@ class VitreaDatabaseReader:
         self.writer = write
         self.data = None
         self.db = VitreaDatabaseModel()
-        self.last_command_sent_timestamp = None
+        # Event loop (monotonic) time of the last write
+        self.last_command_sent_time = None
+        self._load_event = asyncio.Event()
         self.expected_keypads = set()
+        # keypad ID -> bitmask of key IDs that have not been loaded yet
         self.keypads_to_load = None
+        self._result_handlers = {
+            RESULT_META: self._apply_meta,
+            RESULT_MODELS: self._add_models,
+            RESULT_KEY_MODELS: self._add_key_models,
+        }
 
     async def send_command(self, command_generator: BaseParameterCommandGenerator):
-        command = await command_generator.serialize()
+        command = command_generator.serialize()
         await self.writer(command)
-        self.last_command_sent_timestamp = datetime.datetime.now()
+        self.last_command_sent_time = asyncio.get_running_loop().time()
+
+    async def send_commands(self, command_generators: list[BaseParameterCommandGenerator]):
+        """Send several commands with a single write."""
+        if not command_generators:
+            return
+        await self.writer(b"".join(command.serialize() for command in command_generators))
+        self.last_command_sent_time = asyncio.get_running_loop().time()
 
     async def get_floors(self):
         await self.send_command(GetFloorNumbers())
@@ -61,72 +85,85 @@ class VitreaDatabaseReader:
     async def get_scenarios(self):
         await self.send_command(GetScenarioNumbers())
 
+    def _apply_meta(self, meta: dict):
+        for key, value in meta.items():
+            if key == "expected_keypads":
+                self.keypads_to_load = value
+                continue
+            attr = _DB_FIELD_SETTERS.get(key)
+            if attr:
+                setattr(self.db, attr, value)
+
+    def _add_models(self, models: list[BaseVitreaModel]):
+        for model in models:
+            self.db.add_object(model)
+
+    def _add_key_models(self, models: list[BaseVitreaModel]):
+        self._add_models(models)
+        # The key parser always returns the KeyModel last
+        key = models[-1]
+        if not self.keypads_to_load:
+            return
+        pending_keys = self.keypads_to_load.get(key.keypad_id)
+        if pending_keys:
+            pending_keys &= ~(1 << key.id)
+            if pending_keys:
+                self.keypads_to_load[key.keypad_id] = pending_keys
+            else:
+                del self.keypads_to_load[key.keypad_id]
+        if not self.keypads_to_load:
+            self.keypads_to_load = None
+
     async def feed(self, data: bytes):
         try:
             parser = DBResponseParserFactory.create_parser(
                 raw_data=data, send_callback=self.send_command
             )
-            items = await parser.parse_response()
-            if isinstance(items, list):
-                for item in items:
-                    if isinstance(item, BaseVitreaModel):
-                        self.db.add_object(item)
-                    if isinstance(item, KeyModel):
-                        if self.keypads_to_load.get(item.keypad_id, None):
-                            if item.id in self.keypads_to_load[item.keypad_id]:
-                                self.keypads_to_load[item.keypad_id].remove(item.id)
-                            if not self.keypads_to_load[item.keypad_id]:
-                                del self.keypads_to_load[item.keypad_id]
-                        if not self.keypads_to_load:
-                            self.keypads_to_load = None
-            elif isinstance(items, dict):
-                for key, value in items.items():
-                    match key:
-                        case "no_of_floors":
-                            self.db.no_of_floors = value
-                        case "no_of_rooms":
-                            self.db.no_of_rooms = value
-                        case "no_of_keys":
-                            self.db.no_of_keys = value
-                        case "expected_keypads":
-                            self.keypads_to_load = value
-                        case "no_of_acs":
-                            self.db.no_of_acs = value
-                        case "no_of_scenarios":
-                            self.db.no_of_scenarios = value
-                        case _:
-                            pass
+            result = await parser.parse_response()
+            handler = self._result_handlers.get(result.kind)
+            if handler is None:
+                _LOGGER.warning(f"Unknown response for DB Reader: {result}")
             else:
-                _LOGGER.warning(f"Unknown response for DB Reader: {items}")
+                handler(result.payload)
+            self._load_event.set()
         except Exception as e:
             _LOGGER.error(e, stack_info=True)
             
     async def get_missing_keys(self):
-        _LOGGER.warning(f"Getting missing keys: {self.keypads_to_load}")
-        for keypad_id, keys in self.keypads_to_load.items():
+        _LOGGER.debug("Getting missing keys: %s", self.keypads_to_load)
+        commands = []
+        for keypad_id, pending_keys in self.keypads_to_load.items():
             if keypad_id == 0:
                 keypad_id = 256
-            for key_id in keys:
-                await self.send_command(GetKeyParams(keypad_id=int(keypad_id), key_id=int(key_id)))
+            while pending_keys:
+                # Take the lowest pending key off the bitmask
+                lowest_bit = pending_keys & -pending_keys
+                pending_keys ^= lowest_bit
+                commands.append(GetKeyParams(keypad_id=keypad_id, key_id=lowest_bit.bit_length() - 1))
+        await self.send_commands(commands)
 
     async def read_vitrea_controller(
         self, force: bool = False, timeout_seconds: int = 45
     ) -> VitreaDatabaseModel:
         if not self.db.is_loaded() or force:
-            await self.get_floors()
-            await self.get_rooms()
-            await self.get_keypads()
-            await self.get_acs()
-            await self.get_scenarios()
-            timeout = datetime.timedelta(seconds=timeout_seconds)
-            start_time = datetime.datetime.now()
-            while not self.db.is_loaded():
-                if not self.last_command_sent_timestamp:
-                    await asyncio.sleep(0.2)
-                    continue
+            await asyncio.gather(
+                self.get_floors(),
+                self.get_rooms(),
+                self.get_keypads(),
+                self.get_acs(),
+                self.get_scenarios(),
+            )
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_seconds
+            while True:
+                self._load_event.clear()
+                if self.db.is_loaded():
+                    break
+                now = loop.time()
                 if (
-                    datetime.datetime.now() - self.last_command_sent_timestamp
-                ).seconds > 3:
+                    self.last_command_sent_time is not None
+                    and now - self.last_command_sent_time > 3
+                ):
                     if not self.db.is_floors_loaded():
                         _LOGGER.debug("Retrying to get floors")
                         await self.get_floors()
@@ -145,14 +182,20 @@ class VitreaDatabaseReader:
                     if not self.db.is_scenarios_loaded():
                         _LOGGER.debug("Retrying to get scenarios")
                         await self.get_scenarios()
-                if (datetime.datetime.now() - start_time) > timeout:
+                if now > deadline:
                     raise TimeoutError(
                         "Timeout while reading Vitrea DB, not all data was loaded"
                     )
-                await asyncio.sleep(0.2)
+                # Sleep until a response is fed in, a retry is due or the deadline passes
+                last_sent = self.last_command_sent_time or now
+                wake_at = min(deadline, last_sent + 3)
+                try:
+                    await asyncio.wait_for(
+                        self._load_event.wait(), timeout=max(wake_at - loop.time(), 0.2)
+                    )
+                except asyncio.TimeoutError:
+                    pass
         return self.db
 
     def find_which_keypads_are_missing(self):
-        list_of_expected_ids = range(1, 401)
-        list_of_loaded_ids = [keypad.id for keypad in self.db.keypads]
-        return list(set(list_of_expected_ids) - set(list_of_loaded_ids))
+        return list(set(range(1, 401)).difference(keypad.id for keypad in self.db.keypads))
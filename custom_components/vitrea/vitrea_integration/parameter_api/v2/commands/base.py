@@ -1,56 +1,62 @@
 import struct
+from functools import lru_cache
 from ....utils.enums import CommandNumber
 
 
+@lru_cache(maxsize=2048)
+def build_frame(command_number: int, data: bytes) -> bytes:
+    """Return the full frame for a command number and its data bytes."""
+    frame = bytearray(BaseParameterCommandGenerator.HEADER.encode())
+    frame.append(command_number)
+    frame += struct.pack(">H", len(data) + 1)  # 1 byte for checksum
+    frame += data
+    frame.append(sum(frame) & 0xFF)
+    return bytes(frame)
+
+
 class BaseParameterCommandGenerator:
     HEADER = "VTH>"
 
     def __init__(self, command_number: CommandNumber):
         self.command_number = command_number
-        self.command_start = f"{self.HEADER}{chr(self.command_number.value)}"
+        self.command_start = self.HEADER.encode() + bytes([self.command_number.value])
 
-    async def get_length(self, data_length: int = 0):
+    def get_length(self, data_length: int = 0) -> bytes:
         if not hasattr(self, "command_data"):
             raise ValueError(
                 "get_length must be called after setting command_data attribute"
             )
         post_command_length = len(self.command_data) + data_length + 1
-        return "".join(
-            chr(int(ch)) for ch in str(struct.pack(">B", post_command_length).hex())
-        )
+        # Two length bytes, Hi-Lo
+        return struct.pack(">H", post_command_length)
 
-    async def add_checksum(self) -> int:
+    def add_checksum(self) -> int:
         if not hasattr(self, "command_str"):
             raise ValueError(
                 "add_checksum must be called after setting command attribute"
             )
-        checksum = sum(ord(c) for c in self.command_str) % 256
-        self.command_str += chr(checksum & 0xFF)
+        checksum = sum(self.command_str) & 0xFF
+        self.command_str.append(checksum)
         return checksum
 
     @staticmethod
-    async def _byte_list_to_hex(byte_list):
+    def _byte_list_to_hex(byte_list):
         return int.from_bytes(byte_list, byteorder="big")
     
     @staticmethod
-    async def _int_to_hex_word(int_num: int) -> str:
-        result = ""
-        int_with_zeros = format(int_num, "04x")
-        for i in range(0, len(int_with_zeros), 2):
-            int_number = int(int_with_zeros[i : i + 2], 16)
-            result += chr(int_number)
-        return result
-    
-    async def serialize(self):
+    def _int_to_hex_word(int_num: int) -> bytes:
+        return struct.pack(">H", int_num)
+
+    def serialize(self):
         """
         Serialize the command into the format that the VBox expects.
         This method must be implemented by all subclasses.
 
-        :return: The serialized command string.
+        :return: The serialized command bytes.
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
-    async def validate(self):
+    def validate(self):
         """
         Validate the command parameters.
         This can be overridden by subclasses if specific validation logic is needed.
@@ -1,5 +1,5 @@
 from ....utils.enums import CommandNumber
-from .base import BaseParameterCommandGenerator
+from .base import BaseParameterCommandGenerator, build_frame
 
 class GetFloorNumbers(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetFloorNumbers
@@ -7,14 +7,11 @@ class GetFloorNumbers(BaseParameterCommandGenerator):
     def __init__(self, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.floors = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length()
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
+    def serialize(self) -> bytes:
+        return build_frame(self.command_number.value, b"")
     
 class GetFloorParams(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetFloorParams
@@ -23,12 +20,10 @@ class GetFloorParams(BaseParameterCommandGenerator):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.floor_id = floor_id
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.floor_data = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=2)
-        self.command_str += await self._int_to_hex_word(self.floor_id)
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
\ No newline at end of file
+    def serialize(self) -> bytes:
+        return build_frame(
+            self.command_number.value, self._int_to_hex_word(self.floor_id)
+        )
\ No newline at end of file
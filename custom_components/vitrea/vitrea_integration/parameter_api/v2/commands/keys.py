@@ -1,5 +1,5 @@
 from ....utils.enums import CommandNumber
-from .base import BaseParameterCommandGenerator
+from .base import BaseParameterCommandGenerator, build_frame
 
 class GetKeypadNumbers(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetKeypadNumbers
@@ -7,14 +7,11 @@ class GetKeypadNumbers(BaseParameterCommandGenerator):
     def __init__(self, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.keypads = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length()
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
+    def serialize(self) -> bytes:
+        return build_frame(self.command_number.value, b"")
     
 class GetKeyParams(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetKeyParams
@@ -24,12 +21,10 @@ class GetKeyParams(BaseParameterCommandGenerator):
         self.keypad_id = keypad_id
         self.key_id = key_id
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=3)
-        self.command_str += await self._int_to_hex_word(self.keypad_id)
-        self.command_str += chr(self.key_id)
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
\ No newline at end of file
+    def serialize(self) -> bytes:
+        return build_frame(
+            self.command_number.value,
+            self._int_to_hex_word(self.keypad_id) + bytes([self.key_id]),
+        )
\ No newline at end of file
@@ -1,6 +1,5 @@
 from ....utils.enums import CommandNumber
-from .base import BaseParameterCommandGenerator
-from codecs import encode
+from .base import BaseParameterCommandGenerator, build_frame
 
 class GetScenarioNumbers(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetSceneNumbers
@@ -8,14 +7,11 @@ class GetScenarioNumbers(BaseParameterCommandGenerator):
     def __init__(self, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.scenarios = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length()
-        await self.add_checksum()
-        return self.command_str.encode()
+    def serialize(self) -> bytes:
+        return build_frame(self.command_number.value, b"")
     
 class GetScenarioParams(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetSceneParams
@@ -25,12 +21,10 @@ class GetScenarioParams(BaseParameterCommandGenerator):
         self.scenario_id = scenario_id
         self.room_id = None
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.scenario_data = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=2)
-        self.command_str += await self._int_to_hex_word(self.scenario_id)
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
\ No newline at end of file
+    def serialize(self) -> bytes:
+        return build_frame(
+            self.command_number.value, self._int_to_hex_word(self.scenario_id)
+        )
\ No newline at end of file
@@ -1,5 +1,5 @@
 from ....utils.enums import CommandNumber
-from .base import BaseParameterResponseParser
+from .base import BaseParameterResponseParser, ParseResult, RESULT_META, RESULT_MODELS
 from ..commands.floors import GetFloorParams
 from ....models.database import FloorModel
 
@@ -7,19 +7,18 @@ class FloorNumbersParser(BaseParameterResponseParser):
     COMMAND_NUMBER = CommandNumber.GetFloorNumbers
     SHOULD_WRITE = True
     def __init__(self, raw_data:bytes, send_callback):
-        int_data = int.from_bytes(raw_data, byteorder='big')
-        super().__init__(response=int_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
+        super().__init__(response=raw_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
         self.number_of_floors = None
         self.floors_list = None
 
     async def parse_response(self):
-        processed_data = await self.parse_raw()
-        self.number_of_floors = processed_data.pop(0)
-        self.floors_list = await self.combine_bytes_to_words(self.response_hex)
+        processed_data = self.parse_raw()
+        self.number_of_floors = processed_data[0]
+        self.floors_list = self.combine_bytes_to_words(processed_data[1:])
         self.validate_data(self.number_of_floors, self.floors_list)
         for floor in self.floors_list:
             await self.send_callback(GetFloorParams(floor))
-        return {"no_of_floors": self.number_of_floors}
+        return ParseResult(RESULT_META, {"no_of_floors": self.number_of_floors})
     
     def validate_data(self, number_of_floors, floors_list):
         if not number_of_floors == len(floors_list):
@@ -30,21 +29,20 @@ class FloorParamsParser(BaseParameterResponseParser):
     SHOULD_WRITE = False
 
     def __init__(self, raw_data:bytes, send_callback):
-        int_data = int.from_bytes(raw_data, byteorder='big')
-        super().__init__(response=int_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
+        super().__init__(response=raw_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
         self.floor_id = None
         self.floor_name = None
         self.floor_data = None
 
     async def parse_response(self):
-        raw_data = await self.parse_raw()
-        self.floor_id = await self._byte_list_to_hex(raw_data[:2])
+        raw_data = self.parse_raw()
+        self.floor_id = int.from_bytes(raw_data[:2], "big")
         name_len = raw_data[2]
         name_data = raw_data[3:]
-        self.floor_name = await self.byte_list_to_string(name_data)
+        self.floor_name = self.byte_list_to_string(name_data)
         self.validate_data(self.floor_name, name_len)
-        return [FloorModel(id=self.floor_id, name=self.floor_name)]
+        return ParseResult(RESULT_MODELS, [FloorModel(id=self.floor_id, name=self.floor_name)])
     
     def validate_data(self, name, name_len):
-        if not name_len / 2 == len(name):
+        if not name_len == 2 * len(name):
             raise ValueError("Name length mismatch")
\ No newline at end of file
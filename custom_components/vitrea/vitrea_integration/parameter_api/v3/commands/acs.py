@@ -1,5 +1,5 @@
 from ....utils.enums import CommandNumber
-from .base import BaseParameterCommandGenerator
+from .base import BaseParameterCommandGenerator, build_frame
 
 class GetACNumbers(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetACNumbers
@@ -7,14 +7,11 @@ class GetACNumbers(BaseParameterCommandGenerator):
     def __init__(self, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.acs = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length()
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
+    def serialize(self) -> bytes:
+        return build_frame(self.command_value, b"")
     
 class GetACParams(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetACParams
@@ -22,13 +19,12 @@ class GetACParams(BaseParameterCommandGenerator):
     def __init__(self, ac_id: int, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.ac_id = ac_id
+        self.object_id = ac_id
         self.room_id = None
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=2)
-        self.command_str += await self._int_to_hex_word(self.ac_id)
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
\ No newline at end of file
+    def serialize(self) -> bytes:
+        return build_frame(
+            self.command_value, self._int_to_hex_word(self.ac_id)
+        )
\ No newline at end of file
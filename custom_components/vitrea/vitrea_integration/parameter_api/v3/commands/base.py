@@ -1,5 +1,8 @@
 import struct
+from functools import lru_cache
 from ....utils.enums import CommandNumber
+# v2 and v3 share the frame layout, so they share the cached builder
+from ...v2.commands.base import build_frame
 
 
 class BaseParameterCommandGenerator:
@@ -7,41 +10,41 @@ class BaseParameterCommandGenerator:
 
     def __init__(self, command_number: CommandNumber):
         self.command_number = command_number
-        self.command_start = f"{self.HEADER}{chr(self.command_number.value)}"
+        # Plain int, so matching responses does not go through the Enum
+        self.command_value = command_number.value
+        self.command_start = self.HEADER.encode() + bytes([self.command_value])
+        # Identifies the object a params request asks for; 0 for the numbers requests
+        self.object_id = 0
 
-    async def get_length(self, data_length: int = 0):
+    def get_length(self, data_length: int = 0) -> bytes:
         if not hasattr(self, "command_data"):
             raise ValueError(
                 "get_length must be called after setting command_data attribute"
             )
         post_command_length = len(self.command_data) + data_length + 1
-        return "".join(
-            chr(int(ch)) for ch in str(struct.pack(">B", post_command_length).hex())
-        )
+        # Two length bytes, Hi-Lo
+        return struct.pack(">H", post_command_length)
 
-    async def add_checksum(self) -> int:
+    def add_checksum(self) -> int:
         if not hasattr(self, "command_str"):
             raise ValueError(
                 "add_checksum must be called after setting command attribute"
             )
-        checksum = sum(ord(c) for c in self.command_str) % 256
-        self.command_str += chr(checksum & 0xFF)
+        checksum = sum(self.command_str) & 0xFF
+        self.command_str.append(checksum)
         return checksum
 
     @staticmethod
-    async def _byte_list_to_hex(byte_list):
+    def _byte_list_to_hex(byte_list):
         return int.from_bytes(byte_list, byteorder="big")
     
     @staticmethod
-    async def _int_to_hex_word(int_num: int) -> str:
-        result = ""
-        int_with_zeros = format(int_num, "04x")
-        for i in range(0, len(int_with_zeros), 2):
-            int_number = int(int_with_zeros[i : i + 2], 16)
-            result += chr(int_number)
-        return result
+    @lru_cache(maxsize=None)
+    def _int_to_hex_word(int_num: int) -> bytes:
+        # Two bytes, Hi-Lo
+        return struct.pack(">H", int_num)
     
-    async def serialize(self):
+    def serialize(self):
         """
         Serialize the command into the format that the VBox expects.
         This method must be implemented by all subclasses.
@@ -50,7 +53,7 @@ class BaseParameterCommandGenerator:
         """
         raise NotImplementedError("Subclasses must implement this method.")
 
-    async def validate(self):
+    def validate(self):
         """
         Validate the command parameters.
         This can be overridden by subclasses if specific validation logic is needed.
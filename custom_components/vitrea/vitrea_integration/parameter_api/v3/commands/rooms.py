@@ -1,5 +1,5 @@
 from ....utils.enums import CommandNumber
-from .base import BaseParameterCommandGenerator
+from .base import BaseParameterCommandGenerator, build_frame
 
 class GetRoomNumbers(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetRoomNumbers
@@ -7,15 +7,12 @@ class GetRoomNumbers(BaseParameterCommandGenerator):
     def __init__(self, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.rooms = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=1)
-        self.command_str += chr(0) # Group Number = 0 - not used feature in the protocol.
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
+    def serialize(self) -> bytes:
+        # Group Number = 0 - not used feature in the protocol.
+        return build_frame(self.command_value, b"\x00")
     
 class GetRoomParams(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetRoomParams
@@ -23,13 +20,12 @@ class GetRoomParams(BaseParameterCommandGenerator):
     def __init__(self, room_id, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.room_id = room_id
+        self.object_id = room_id
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.room_data = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=2)
-        self.command_str += await self._int_to_hex_word(self.room_id)
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
\ No newline at end of file
+    def serialize(self) -> bytes:
+        return build_frame(
+            self.command_value, self._int_to_hex_word(self.room_id)
+        )
\ No newline at end of file
@@ -1,5 +1,5 @@
 from ....utils.enums import CommandNumber
-from .base import BaseParameterCommandGenerator
+from .base import BaseParameterCommandGenerator, build_frame
 from codecs import encode
 
 class GetScenarioNumbers(BaseParameterCommandGenerator):
@@ -8,14 +8,11 @@ class GetScenarioNumbers(BaseParameterCommandGenerator):
     def __init__(self, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.scenarios = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length()
-        await self.add_checksum()
-        return self.command_str.encode()
+    def serialize(self) -> bytes:
+        return build_frame(self.command_value, b"")
     
 class GetScenarioParams(BaseParameterCommandGenerator):
     COMMAND_NUMBER = CommandNumber.GetSceneParams
@@ -23,14 +20,13 @@ class GetScenarioParams(BaseParameterCommandGenerator):
     def __init__(self, scenario_id, *args, **kwargs):
         super().__init__(command_number=self.COMMAND_NUMBER, *args)
         self.scenario_id = scenario_id
+        self.object_id = scenario_id
         self.room_id = None
         self.command_data = ""
-        self.command_str = ""
+        self.command_str = bytearray()
         self.scenario_data = None
 
-    async def serialize(self) -> bytes:
-        self.command_str = self.command_start
-        self.command_str += await self.get_length(data_length=2)
-        self.command_str += await self._int_to_hex_word(self.scenario_id)
-        await self.add_checksum()
-        return self.command_str.encode(encoding="raw_unicode_escape")
\ No newline at end of file
+    def serialize(self) -> bytes:
+        return build_frame(
+            self.command_value, self._int_to_hex_word(self.scenario_id)
+        )
\ No newline at end of file
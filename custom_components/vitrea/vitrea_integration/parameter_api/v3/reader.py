@@ -1,14 +1,14 @@
 import asyncio
-import datetime
+from collections import deque
 import logging
-from typing import Callable, Optional
+from typing import Callable, Iterable
 
-from .commands.acs import GetACNumbers
+from .commands.acs import GetACNumbers, GetACParams
 from .commands.base import BaseParameterCommandGenerator
-from .commands.floors import GetFloorNumbers
-from .commands.keys import GetKeypadNumbers
-from .commands.rooms import GetRoomNumbers
-from .commands.scenarios import GetScenarioNumbers
+from .commands.floors import GetFloorNumbers, GetFloorParams
+from .commands.keys import GetKeypadNumbers, GetKeyParams
+from .commands.rooms import GetRoomNumbers, GetRoomParams
+from .commands.scenarios import GetScenarioNumbers, GetScenarioParams
 from .responses.parser import DBResponseParserFactory
 
 from ...models.database import (
@@ -24,93 +24,91 @@ from ...models.database import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Params requests queued per entity type, and workers sending them, while reading the database
+PARAMS_WINDOW = 8
+
 
 class SequentialCallback:
     """
     Callback wrapper that provides sequential processing capabilities.
     
     This class wraps the reader and provides methods to:
-    - Queue commands for sequential execution
+    - Queue commands for execution after the current response
     - Store pending items for each entity type
-    - Queue the next item request after processing current response
+    - Queue the next item requests after processing current response
     """
 
     def __init__(self, reader):
         self.reader = reader
 
+    @property
+    def window(self) -> int:
+        """Number of params requests to keep in flight per entity type."""
+        return self.reader.params_window
+
     async def __call__(self, command_generator: BaseParameterCommandGenerator):
         """Queue a command to be sent after current request completes."""
         await self.reader._queue_command(command_generator)
 
-    def store_pending_floors(self, floors_list: list):
+    def store_pending_floors(self, floors_list: Iterable[int]):
         """Store pending floor IDs to process sequentially."""
-        self.reader._pending_floors = floors_list.copy()
+        self.reader._pending_floors = deque(floors_list)
 
-    def store_pending_rooms(self, rooms_list: list):
+    def store_pending_rooms(self, rooms_list: Iterable[int]):
         """Store pending room IDs to process sequentially."""
-        self.reader._pending_rooms = rooms_list.copy()
+        self.reader._pending_rooms = deque(rooms_list)
 
-    def store_pending_acs(self, acs_list: list):
+    def store_pending_acs(self, acs_list: Iterable[int]):
         """Store pending AC IDs to process sequentially."""
-        self.reader._pending_acs = acs_list.copy()
+        self.reader._pending_acs = deque(acs_list)
 
-    def store_pending_scenarios(self, scenarios_list: list):
+    def store_pending_scenarios(self, scenarios_list: Iterable[int]):
         """Store pending scenario IDs to process sequentially."""
-        self.reader._pending_scenarios = scenarios_list.copy()
+        self.reader._pending_scenarios = deque(scenarios_list)
 
-    def store_pending_keys(self, keys_dict: dict):
-        """Store pending keys structure: {keypad_id: [key_id1, key_id2, ...]}"""
-        self.reader._pending_keys = keys_dict.copy()
+    def store_pending_keys(self, keys_list: Iterable[tuple[int, int]]):
+        """Store pending (keypad_id, key_id) pairs to process sequentially."""
+        self.reader._pending_keys = deque(keys_list)
 
-    async def queue_next_floor(self):
-        """Queue next floor params request if any pending."""
-        if self.reader._pending_floors:
-            floor_id = self.reader._pending_floors.pop(0)
-            from .commands.floors import GetFloorParams
+    async def queue_next_floor(self, count: int = 1):
+        """Queue the next `count` floor params requests if any pending."""
+        for _ in range(count):
+            if not self.reader._pending_floors:
+                return
+            floor_id = self.reader._pending_floors.popleft()
             await self.reader._queue_command(GetFloorParams(floor_id))
 
-    async def queue_next_room(self):
-        """Queue next room params request if any pending."""
-        if self.reader._pending_rooms:
-            room_id = self.reader._pending_rooms.pop(0)
-            from .commands.rooms import GetRoomParams
+    async def queue_next_room(self, count: int = 1):
+        """Queue the next `count` room params requests if any pending."""
+        for _ in range(count):
+            if not self.reader._pending_rooms:
+                return
+            room_id = self.reader._pending_rooms.popleft()
             await self.reader._queue_command(GetRoomParams(room_id))
 
-    async def queue_next_ac(self):
-        """Queue next AC params request if any pending."""
-        if self.reader._pending_acs:
-            ac_id = self.reader._pending_acs.pop(0)
-            from .commands.acs import GetACParams
+    async def queue_next_ac(self, count: int = 1):
+        """Queue the next `count` AC params requests if any pending."""
+        for _ in range(count):
+            if not self.reader._pending_acs:
+                return
+            ac_id = self.reader._pending_acs.popleft()
             await self.reader._queue_command(GetACParams(ac_id))
 
-    async def queue_next_scenario(self):
-        """Queue next scenario params request if any pending."""
-        if self.reader._pending_scenarios:
-            scenario_id = self.reader._pending_scenarios.pop(0)
-            from .commands.scenarios import GetScenarioParams
+    async def queue_next_scenario(self, count: int = 1):
+        """Queue the next `count` scenario params requests if any pending."""
+        for _ in range(count):
+            if not self.reader._pending_scenarios:
+                return
+            scenario_id = self.reader._pending_scenarios.popleft()
             await self.reader._queue_command(GetScenarioParams(scenario_id))
 
-    async def queue_next_key(self):
-        """Queue next key params request if any pending."""
-        if not self.reader._pending_keys:
-            return
-        
-        # Find first keypad with remaining keys
-        for keypad_id, key_ids in list(self.reader._pending_keys.items()):
-            if key_ids:
-                key_id = key_ids.pop(0)
-                # Remove keypad entry if no more keys
-                if not key_ids:
-                    del self.reader._pending_keys[keypad_id]
-                
-                # Convert keypad_id 0 to 256 (as per v2 behavior)
-                request_keypad_id = keypad_id
-                if keypad_id == 0:
-                    request_keypad_id = 256
-                
-                from .commands.keys import GetKeyParams
-                await self.reader._queue_command(GetKeyParams(keypad_id=request_keypad_id, key_id=key_id))
+    async def queue_next_key(self, count: int = 1):
+        """Queue the next `count` key params requests if any pending."""
+        for _ in range(count):
+            if not self.reader._pending_keys:
                 return
+            keypad_id, key_id = self.reader._pending_keys.popleft()
+            await self.reader._queue_command(GetKeyParams(keypad_id=keypad_id, key_id=key_id))
 
 
 class VitreaDatabaseReader:
@@ -118,31 +116,36 @@ class VitreaDatabaseReader:
     Read the Vitrea database and store data in a structured way.
 
     This class requires a write callback to send commands to the Vitrea controller.
-    It implements a promise-based sequential request/response system to ensure
-    commands are sent only after receiving the previous command's response.
+    It implements a promise-based request/response system. Floors, rooms, keys,
+    ACs and scenarios are read as independent streams that run concurrently.
+    Each stream queues up to `params_window` params requests and every response
+    queues the next pending one; `params_window` workers send queued requests. Responses are routed to
+    their request by the command number and the object ID they carry.
 
     Attributes:
         writer: Callback function for sending commands
         db: VitreaDatabaseModel instance storing the parsed database
-        pending_request: Future object for the current pending request
-        request_lock: Lock ensuring sequential command execution
+        pending_requests: Future of each in-flight request, per (command number, object ID)
+        params_window: Params requests queued per entity type, and number of follow-up workers
     """
 
-    def __init__(self, write: Callable):
+    def __init__(self, write: Callable, params_window: int = PARAMS_WINDOW):
         """Initialize the database reader with a write callback."""
         self.writer = write
         self.db = VitreaDatabaseModel()
-        self.pending_request: Optional[asyncio.Future] = None
-        self.request_lock = asyncio.Lock()
-        self._follow_up_commands = []
-        self._follow_up_task: Optional[asyncio.Task] = None
+        self.pending_requests: dict[tuple[int, int], asyncio.Future] = {}
+        self.params_window = params_window
+        # Follow-up commands queued by the parsers, sent by params_window workers
+        self._follow_up_queue: asyncio.Queue = asyncio.Queue()
         # Sequential processing state
-        self._pending_floors = []
-        self._pending_rooms = []
-        self._pending_acs = []
-        self._pending_scenarios = []
-        self._pending_keys = {}  # Dict: {keypad_id: [key_id1, key_id2, ...]}
+        self._pending_floors = deque()
+        self._pending_rooms = deque()
+        self._pending_acs = deque()
+        self._pending_scenarios = deque()
+        self._pending_keys = deque()  # (keypad_id, key_id) pairs
         self._sequential_callback = SequentialCallback(self)
+        # Set by feed() once every expected object was added to the database
+        self._loaded_event = asyncio.Event()
 
     async def send_command(
         self, command_generator: BaseParameterCommandGenerator, timeout: float = 1.0, current_attempt: int = 0, 
@@ -164,45 +167,27 @@ class VitreaDatabaseReader:
         _LOGGER.debug("send_command() called for: %s", command_generator.command_number)
         if current_attempt >= max_attempts:
             raise TimeoutError(f"Max attempts reached for command {command_generator.command_number}")
-        async with self.request_lock:
-            # Wait for any pending request to complete
-            if self.pending_request and not self.pending_request.done():
-                _LOGGER.debug("Waiting for previous request to complete")
-                try:
-                    await self.pending_request
-                except Exception:
-                    pass  # Previous request failed, continue
-
-            # Create new promise for this request
-            self.pending_request = asyncio.Future()
-            command = await command_generator.serialize()
-            _LOGGER.debug("Sending command: %s", command.hex())
-            await self.writer(command)
-
-            # Store reference to the Future before releasing lock
-            future = self.pending_request
-
-        # Wait for response outside the lock (will be resolved by feed())
+        request_key = (command_generator.command_value, command_generator.object_id)
+        # Create new promise for this request, registered before writing so
+        # that feed() finds it however fast the response arrives.
+        # The event loop runs one coroutine at a time, so no lock is needed.
+        future = asyncio.get_running_loop().create_future()
+        self.pending_requests[request_key] = future
+        command = command_generator.serialize()
+        _LOGGER.debug("Sending command: %s", command.hex())
+        await self.writer(command)
+
+        # Wait for response (will be resolved by feed())
         _LOGGER.debug("Waiting for response with timeout: %s", timeout)
         try:
             result = await asyncio.wait_for(future, timeout=timeout)
             _LOGGER.debug("Received response result: %s", result)
-            # Wait for any follow-up commands to complete before returning
-            # This ensures all follow-ups (including nested ones) are done
-            if self._follow_up_task and not self._follow_up_task.done():
-                _LOGGER.debug("Waiting for follow-up commands to complete")
-                try:
-                    await self._follow_up_task
-                except Exception as e:
-                    _LOGGER.error("Error in follow-up task: %s", e)
-                    # Follow-up commands failed, but original command succeeded
             return result
         except (asyncio.TimeoutError, asyncio.CancelledError) as e:
             _LOGGER.error("Timeout or cancellation waiting for response: %s", e)
             # Clear pending request if it timed out or was cancelled
-            async with self.request_lock:
-                if self.pending_request is future:
-                    self.pending_request = None
+            if self.pending_requests.get(request_key) is future:
+                del self.pending_requests[request_key]
             if isinstance(e, asyncio.TimeoutError):
                 return await self.send_command(command_generator, timeout, current_attempt + 1, max_attempts)
             raise e
@@ -228,20 +213,24 @@ class VitreaDatabaseReader:
         await self.send_command(GetScenarioNumbers())
 
     async def _queue_command(self, command_generator: BaseParameterCommandGenerator):
-        """Queue a command to be sent after current request completes."""
-        self._follow_up_commands.append(command_generator)
-
-    async def _process_follow_up_commands(self):
-        """Process queued follow-up commands sequentially.
-        
-        Each command is processed and all its nested follow-ups complete
-        before moving to the next command, since send_command() waits for
-        follow-up tasks to complete.
+        """Queue a command to be sent by a follow-up worker."""
+        await self._follow_up_queue.put(command_generator)
+
+    async def _follow_up_loop(self):
+        """Send queued follow-up commands until cancelled.
+
+        A response queues its follow-ups while it is parsed, which is before
+        send_command() returns and the command is marked done. So once the
+        queue is joined, every follow-up, including nested ones, completed.
         """
-        while self._follow_up_commands:
-            command_generator = self._follow_up_commands.pop(0)
-            # Wait for this command and all its nested follow-ups to complete
-            await self.send_command(command_generator)
+        while True:
+            command_generator = await self._follow_up_queue.get()
+            try:
+                await self.send_command(command_generator)
+            except Exception as e:
+                _LOGGER.error("Error processing follow-up command: %s", e)
+            finally:
+                self._follow_up_queue.task_done()
 
     async def feed(self, data: bytes):
         """
@@ -251,17 +240,24 @@ class VitreaDatabaseReader:
             data: Raw response bytes from controller
         """
         _LOGGER.debug("feed() called with data: %s", data.hex()[:50])
-        # Resolve pending promise if it exists
+        parser = DBResponseParserFactory.create_parser(
+            raw_data=data, send_callback=self._sequential_callback
+        )
+        if parser is None:
+            _LOGGER.error("Parser is None for data: %s", data.hex())
+            return
+        _LOGGER.debug("Created parser: %s", parser.__class__.__name__)
+
+        # Resolve the pending promise of the request this response answers
+        request_key = (data[4], parser.object_id(data))
         future_to_resolve = None
-        async with self.request_lock:
-            if self.pending_request and not self.pending_request.done():
-                future_to_resolve = self.pending_request
-                self.pending_request = None  # Clear before resolving to prevent race
-                _LOGGER.debug("Found pending request to resolve")
-            else:
-                _LOGGER.debug("No pending request found (pending_request: %s, done: %s)", 
-                             self.pending_request, 
-                             self.pending_request.done() if self.pending_request else None)
+        pending_request = self.pending_requests.pop(request_key, None)
+        if pending_request and not pending_request.done():
+            future_to_resolve = pending_request
+            _LOGGER.debug("Found pending request to resolve")
+        else:
+            _LOGGER.debug("No pending request found for %s (pending_request: %s)",
+                         request_key, pending_request)
 
         if future_to_resolve is None:
             # No pending request, this might be an unsolicited response
@@ -269,15 +265,6 @@ class VitreaDatabaseReader:
             return
 
         try:
-            parser = DBResponseParserFactory.create_parser(
-                raw_data=data, send_callback=self._sequential_callback
-            )
-            if parser is None:
-                _LOGGER.error("Parser is None for data: %s", data.hex())
-                if not future_to_resolve.done():
-                    future_to_resolve.set_exception(ValueError("No parser found for response"))
-                return
-            _LOGGER.debug("Created parser: %s", parser.__class__.__name__)
             items = await parser.parse_response()
             _LOGGER.debug("Parser returned items: %s", type(items))
 
@@ -303,32 +290,16 @@ class VitreaDatabaseReader:
                             pass
             else:
                 _LOGGER.warning("Unknown response for DB Reader: %s", items)
+            if self.db.is_loaded():
+                self._loaded_event.set()
 
-            # Resolve promise first so send_command() can continue
+            # Resolve promise so send_command() can continue
             if not future_to_resolve.done():
                 _LOGGER.debug("Resolving promise with result")
                 future_to_resolve.set_result(items)
             else:
                 _LOGGER.warning("Future already done, cannot resolve")
 
-            # Process follow-up commands asynchronously as a task
-            # send_command() will wait for this task to complete
-            if self._follow_up_commands:
-                async def process_follow_ups():
-                    try:
-                        await self._process_follow_up_commands()
-                    except Exception as e:
-                        _LOGGER.error("Error processing follow-up commands: %s", e)
-                        raise
-                    finally:
-                        # Clear the task reference when done
-                        self._follow_up_task = None
-                
-                self._follow_up_task = asyncio.create_task(process_follow_ups())
-            else:
-                # No follow-up commands, clear any existing task
-                self._follow_up_task = None
-
         except Exception as e:
             _LOGGER.error(e, stack_info=True)
             # Reject promise on error
@@ -336,14 +307,36 @@ class VitreaDatabaseReader:
                 future_to_resolve.set_exception(e)
             raise
 
+    async def _fetch_all(self):
+        """Fetch every entity type and wait until the follow-up queue is joined."""
+        loop = asyncio.get_running_loop()
+        fetches = [
+            loop.create_task(get())
+            for get in (
+                self.get_floors,
+                self.get_rooms,
+                self.get_keypads,
+                self.get_acs,
+                self.get_scenarios,
+            )
+        ]
+        try:
+            await asyncio.gather(*fetches)
+        finally:
+            # A failed or cancelled fetch must not leave its siblings writing to the controller
+            for fetch in fetches:
+                fetch.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
+        await self._follow_up_queue.join()
+
     async def read_vitrea_controller(
         self, force: bool = False, timeout_seconds: int = 45
     ) -> VitreaDatabaseModel:
         """
-        Sequentially read all database data from the Vitrea controller.
+        Read all database data from the Vitrea controller.
 
-        Commands are sent one at a time, waiting for each response and all
-        follow-up commands to complete before proceeding to the next command.
+        The floors, rooms, keys, ACs and scenarios are fetched concurrently.
+        Each fetch waits for its response and all its follow-up commands.
 
         Args:
             force: Force reload even if database is already loaded
@@ -356,45 +349,45 @@ class VitreaDatabaseReader:
             TimeoutError: If operation doesn't complete within timeout
         """
         if not self.db.is_loaded() or force:
-            timeout = datetime.timedelta(seconds=timeout_seconds)
-            start_time = datetime.datetime.now()
-            
-            # Send commands sequentially, waiting for each response and all follow-ups
-            _LOGGER.debug("Starting database read - getting floors")
-            await self.get_floors()  # Waits for response and all floor follow-ups
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_seconds
+            self._loaded_event.clear()
+            workers = [
+                loop.create_task(self._follow_up_loop()) for _ in range(self.params_window)
+            ]
+            try:
+                # Fetch every entity type concurrently, then wait for all their follow-ups
+                _LOGGER.debug("Starting database read")
+                await asyncio.wait_for(
+                    self._fetch_all(), timeout=max(deadline - loop.time(), 0)
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Timeout waiting for the database read and its follow-up commands")
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                # Let a worker stopped mid send_command() clear its pending request
+                await asyncio.gather(*workers, return_exceptions=True)
+                # Drop follow-ups that were never sent, so the next read starts from an empty queue
+                while not self._follow_up_queue.empty():
+                    self._follow_up_queue.get_nowait()
+                    self._follow_up_queue.task_done()
             _LOGGER.debug("Floors loaded: %d/%d", len(self.db.floors), self.db.no_of_floors)
-            
-            await self.get_rooms()  # Waits for response and all room follow-ups
             _LOGGER.debug("Rooms loaded: %d/%d", len(self.db.rooms), self.db.no_of_rooms)
-            
-            await self.get_keypads()  # Waits for response and all keypad follow-ups
             _LOGGER.debug("Keypads loaded: %d", len(self.db.keypads))
-            
-            await self.get_acs()  # Waits for response and all AC follow-ups
             _LOGGER.debug("ACs loaded: %d/%d", len(self.db.air_conditioners), self.db.no_of_acs)
-            
-            await self.get_scenarios()  # Waits for response and all scenario follow-ups
             _LOGGER.debug("Scenarios loaded: %d/%d", len(self.db.scenarios), self.db.no_of_scenarios)
 
-            # Ensure all follow-up tasks have completed
-            if self._follow_up_task and not self._follow_up_task.done():
-                _LOGGER.debug("Waiting for final follow-up commands to complete")
+            # Final check that database is fully loaded
+            # The follow-up queue was joined, so this should be immediate unless the read timed out
+            if not self.db.is_loaded():
+                remaining = max(deadline - loop.time(), 0)
                 try:
-                    await asyncio.wait_for(self._follow_up_task, timeout=timeout_seconds)
+                    await asyncio.wait_for(self._loaded_event.wait(), timeout=min(remaining, 5))
                 except asyncio.TimeoutError:
-                    _LOGGER.warning("Timeout waiting for final follow-up commands")
-
-            # Final check that database is fully loaded
-            # Since send_command() waits for follow-ups, this should be immediate
-            attempts = 0
-            max_attempts = 50  # 5 seconds max (50 * 0.1s)
-            while not self.db.is_loaded():
-                attempts += 1
-                if attempts > max_attempts:
                     _LOGGER.error(
-                        "Database loading check failed after %d attempts. "
+                        "Database loading check failed. "
                         "Floors: %d/%d, Rooms: %d/%d, Keys: %d/%d, ACs: %d/%d, Scenarios: %d/%d",
-                        max_attempts,
                         len(self.db.floors), self.db.no_of_floors,
                         len(self.db.rooms), self.db.no_of_rooms,
                         len(self.db.keys), self.db.no_of_keys,
@@ -408,12 +401,7 @@ class VitreaDatabaseReader:
                         f"Keys: {len(self.db.keys)}/{self.db.no_of_keys}, "
                         f"ACs: {len(self.db.air_conditioners)}/{self.db.no_of_acs}, "
                         f"Scenarios: {len(self.db.scenarios)}/{self.db.no_of_scenarios}"
-                    )
-                if (datetime.datetime.now() - start_time) > timeout:
-                    raise TimeoutError(
-                        "Timeout while reading Vitrea DB, not all data was loaded"
-                    )
-                await asyncio.sleep(0.1)
+                    ) from None
             
             _LOGGER.debug("Database fully loaded")
         return self.db
@@ -1,29 +1,29 @@
-from ....utils.enums import CommandNumber, AirConditionerType
+from ....utils.enums import CommandNumber, AIR_CONDITIONER_TYPE_BY_VALUE
 from .base import BaseParameterResponseParser
-from ..commands.acs import GetACParams
 from ....models.database import AirConditionerModel
+import struct
+
+# AC params header: AC ID, AC type (ASCII digit), room ID, name length
+_AC_PARAMS_HEADER = struct.Struct(">HBHB")
 
 class ACNumbersParser(BaseParameterResponseParser):
     COMMAND_NUMBER = CommandNumber.GetACNumbers
     SHOULD_WRITE = True
+    __slots__ = ("number_of_acs", "acs_list")
     def __init__(self, raw_data:bytes, send_callback):
-        int_data = int.from_bytes(raw_data, byteorder='big')
-        super().__init__(response=int_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
+        super().__init__(response_bytes=raw_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
         self.number_of_acs = None
         self.acs_list = None
 
     async def parse_response(self):
-        processed_data = await self.parse_raw()
-        self.number_of_acs = processed_data.pop(0)
-        self.acs_list = await self.combine_bytes_to_words(processed_data)
+        processed_data = self.parse_raw()
+        self.number_of_acs = processed_data[0]
+        self.validate_records_length(processed_data[1:], self.number_of_acs, 2)
+        self.acs_list = self.combine_bytes_to_words(processed_data[1:])
         self.validate_data(self.number_of_acs, self.acs_list)
-        # Store remaining ACs for sequential processing (excluding first, which we queue now)
-        if len(self.acs_list) > 1:
-            self.send_callback.store_pending_acs(self.acs_list[1:])
-        # Queue only the first AC params request
-        if self.acs_list:
-            from ..commands.acs import GetACParams
-            await self.send_callback(GetACParams(self.acs_list[0]))
+        # Keep a window of AC params requests in flight, each response queues the next
+        self.send_callback.store_pending_acs(self.acs_list)
+        await self.send_callback.queue_next_ac(count=self.send_callback.window)
         return {"no_of_acs": self.number_of_acs}
     
     def validate_data(self, number_of_acs, acs_list):
@@ -32,23 +32,26 @@ class ACNumbersParser(BaseParameterResponseParser):
     
 class ACParamsParser(BaseParameterResponseParser):
     COMMAND_NUMBER = CommandNumber.GetACParams
+    OBJECT_ID_LENGTH = 2
     SHOULD_WRITE = False
+    __slots__ = ("ac_id", "ac_name", "ac_data")
 
     def __init__(self, raw_data:bytes, send_callback):
-        int_data = int.from_bytes(raw_data, byteorder='big')
-        super().__init__(response=int_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
+        super().__init__(response_bytes=raw_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
         self.ac_id = None
         self.ac_name = None
         self.ac_data = None
 
     async def parse_response(self):
-        proccessed_data = await self.parse_raw()
-        ac_id = await self._byte_list_to_hex(proccessed_data[:2])
-        ac_type = AirConditionerType(await self._ascii_digit_to_int(proccessed_data[2]))
-        room_id = await self._byte_list_to_hex(proccessed_data[3:5])
-        name_len = proccessed_data[5]
-        name_data = proccessed_data[6:]
-        ac_name = await self.byte_list_to_string(name_data)
+        # Fields are sliced from the memoryview, only the name is copied to decode it
+        data = self.parse_raw()
+        ac_id, ac_type_digit, room_id, name_len = _AC_PARAMS_HEADER.unpack_from(data)
+        ac_type_value = self._ascii_digit_to_int(ac_type_digit)
+        try:
+            ac_type = AIR_CONDITIONER_TYPE_BY_VALUE[ac_type_value]
+        except KeyError:
+            raise ValueError(f"Unknown AC type {ac_type_value}") from None
+        ac_name = self.byte_list_to_string(data[_AC_PARAMS_HEADER.size:])
         self.validate_data(ac_name, name_len)
         result = [AirConditionerModel(id=ac_id, name=ac_name, type=ac_type, room_id=room_id)]
         # Queue next AC params request if any pending
@@ -56,11 +59,11 @@ class ACParamsParser(BaseParameterResponseParser):
         return result
     
     def validate_data(self, name, name_len):
-        if not name_len / 2 == len(name):
+        if not name_len == 2 * len(name):
             raise ValueError("Name length mismatch")
         
     @staticmethod
-    async def _ascii_digit_to_int(digit: int) -> int:
+    def _ascii_digit_to_int(digit: int) -> int:
         if not 48 <= digit <= 57:
             raise ValueError("Not a digit")
         return digit - 48
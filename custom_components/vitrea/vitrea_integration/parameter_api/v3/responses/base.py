@@ -6,11 +6,27 @@ from ....models.database import BaseVitreaModel
 
 class BaseParameterResponseParser:
     RESPONSE_HEADER = "VTH<"
+    RESPONSE_HEADER_BYTES = RESPONSE_HEADER.encode()
+    # Names are sent as UTF-16 with the low byte first
+    NAME_ENCODING = "utf-16-le"
+    # Data bytes identifying the object a response belongs to; 0 for the numbers responses
+    OBJECT_ID_LENGTH = 0
+    # Parsers are created per frame, so they keep their attributes in slots rather than a __dict__
+    __slots__ = (
+        "command_number",
+        "command_value",
+        "response_bytes",
+        "response_dict",
+        "send_callback",
+        "data_length",
+        "response_hex",
+    )
 
-    def __init__(self, response: int, command_number: CommandNumber, send_callback:Callable):
+    def __init__(self, response_bytes: bytes, command_number: CommandNumber, send_callback:Callable):
         self.command_number = command_number
-        self.response = response
-        self.response_bytes = None
+        self.command_value = command_number.value
+        # A view, so slicing out fields does not copy the frame
+        self.response_bytes = memoryview(response_bytes)
         self.response_dict = None
         self.send_callback = send_callback
 
@@ -18,6 +34,10 @@ class BaseParameterResponseParser:
     async def parse_response(self) -> list[BaseVitreaModel]:
         raise NotImplementedError
     
+    @classmethod
+    def object_id(cls, raw_data: bytes) -> int:
+        return int.from_bytes(raw_data[7 : 7 + cls.OBJECT_ID_LENGTH], byteorder="big")
+
     @property
     def SHOULD_WRITE(self):
         raise NotImplementedError
@@ -26,69 +46,41 @@ class BaseParameterResponseParser:
     def COMMAND_NUMBER(self):
         raise NotImplementedError
 
-    @staticmethod
-    async def _hex_to_byte_list(hex_int):
-        # Convert the hex integer to a binary string, removing the '0b' prefix
-        binary_str = bin(hex_int)[2:]
-
-        # Pad the binary string to make its length a multiple of 8
-        padded_binary = binary_str.zfill(len(binary_str) + 8 - len(binary_str) % 8)
-
-        # Split the binary string into chunks of 8 bits
-        byte_chunks = [
-            padded_binary[i : i + 8] for i in range(0, len(padded_binary), 8)
-        ]
-
-        # Convert each chunk back to an integer
-        byte_list = [int(chunk, 2) for chunk in byte_chunks]
+    def byte_list_to_string(self, byte_list):
+        # Decodes straight from the response view, without copying it to bytes first
+        return str(byte_list, self.NAME_ENCODING)
 
-        return byte_list
-
-    async def byte_list_to_string(self, byte_list):
-        word_list = await self.combine_bytes_to_words(byte_list)
-        result = ""
-        for word in word_list:
-            packed_word = struct.pack("<H", word)
-            decoded_char = packed_word.decode("utf-16be")
-            result += decoded_char
-        return result
+    @staticmethod
+    def validate_checksum(response_bytes: memoryview):
+        # Slicing the view does not copy, and sum() runs over it in C
+        return sum(response_bytes[:-1]) & 0xFF == response_bytes[-1]
 
     @staticmethod
-    async def validate_checksum(response_bytes: list):
-        return sum(response_bytes[0:-1]) % 256 == response_bytes[-1]
+    def validate_records_length(records, count, record_size):
+        # Checked before unpacking, so a corrupt frame is rejected without building its list
+        if not len(records) == count * record_size:
+            raise ValueError("Data length does not match the number of records")
 
     @staticmethod
-    async def combine_bytes_to_words(byte_list):
-        word_list = []
-        for i in range(0, len(byte_list), 2):
-            # Combine each pair of bytes into a word (16-bit integer)
-            word = (byte_list[i] << 8) + byte_list[i + 1]
-            word_list.append(word)
-        return word_list
+    def combine_bytes_to_words(byte_list):
+        # Combine each pair of bytes into a big-endian word (16-bit integer)
+        # Unpacks straight from the response memoryview, without copying it
+        return [word for (word,) in struct.iter_unpack(">H", byte_list)]
     
-    @staticmethod
-    async def _byte_list_to_hex(byte_list):
-        return int.from_bytes(byte_list, byteorder="big")
-
-    async def validate(self):
-        if not await self.validate_checksum(self.response_bytes):
+    def validate(self):
+        # parse_raw() reads data_length before validating
+        if not self.validate_checksum(self.response_bytes):
             raise ValueError("Invalid checksum")
-        for i, b in enumerate(self.response_bytes[0:4]):
-            if b != ord(self.RESPONSE_HEADER[i]):
-                raise ValueError("Invalid header")
-        if not self.response_bytes[4] == self.command_number.value:
+        if self.response_bytes[0:4] != self.RESPONSE_HEADER_BYTES:
+            raise ValueError("Invalid header")
+        if not self.response_bytes[4] == self.command_value:
             raise ValueError("Wrong Command")
-        self.data_length = struct.unpack(">H", bytes(self.response_bytes[5:7]))[0]
-        if not self.data_length == len(self.response_bytes[7:]):
+        if not self.data_length == len(self.response_bytes) - 7:
             raise ValueError("Invalid data length")
 
-    async def parse_raw(self):
+    def parse_raw(self):
         if not self.response_dict:
-            self.response_bytes = await self._hex_to_byte_list(self.response)
-            self.data_length = struct.unpack(">H", bytes(self.response_bytes[5:7]))[0]
-            await self.validate()
-            
-            response_length = struct.unpack(">H", bytes(self.response_bytes[5:7]))[0]
-            data = self.response_bytes[7:-1]
-            self.response_hex = data
-        return self.response_hex
\ No newline at end of file
+            self.data_length = int.from_bytes(self.response_bytes[5:7], byteorder="big")
+            self.validate()
+            self.response_hex = self.response_bytes[7:-1]
+        return self.response_hex
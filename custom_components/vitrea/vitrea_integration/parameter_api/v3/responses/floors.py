@@ -1,29 +1,29 @@
 from ....utils.enums import CommandNumber
 from .base import BaseParameterResponseParser
-from ..commands.floors import GetFloorParams
 from ....models.database import FloorModel
+import struct
+
+# Floor params header: floor ID, name length
+_FLOOR_PARAMS_HEADER = struct.Struct(">HB")
 
 class FloorNumbersParser(BaseParameterResponseParser):
     COMMAND_NUMBER = CommandNumber.GetFloorNumbers
     SHOULD_WRITE = True
+    __slots__ = ("number_of_floors", "floors_list")
     def __init__(self, raw_data:bytes, send_callback):
-        int_data = int.from_bytes(raw_data, byteorder='big')
-        super().__init__(response=int_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
+        super().__init__(response_bytes=raw_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
         self.number_of_floors = None
         self.floors_list = None
 
     async def parse_response(self):
-        processed_data = await self.parse_raw()
-        self.number_of_floors = processed_data.pop(0)
-        self.floors_list = await self.combine_bytes_to_words(self.response_hex)
+        processed_data = self.parse_raw()
+        self.number_of_floors = processed_data[0]
+        self.validate_records_length(processed_data[1:], self.number_of_floors, 2)
+        self.floors_list = self.combine_bytes_to_words(processed_data[1:])
         self.validate_data(self.number_of_floors, self.floors_list)
-        # Store remaining floors for sequential processing (excluding first, which we queue now)
-        if len(self.floors_list) > 1:
-            self.send_callback.store_pending_floors(self.floors_list[1:])
-        # Queue only the first floor params request
-        if self.floors_list:
-            from ..commands.floors import GetFloorParams
-            await self.send_callback(GetFloorParams(self.floors_list[0]))
+        # Keep a window of floor params requests in flight, each response queues the next
+        self.send_callback.store_pending_floors(self.floors_list)
+        await self.send_callback.queue_next_floor(count=self.send_callback.window)
         return {"no_of_floors": self.number_of_floors}
     
     def validate_data(self, number_of_floors, floors_list):
@@ -32,21 +32,21 @@ class FloorNumbersParser(BaseParameterResponseParser):
 
 class FloorParamsParser(BaseParameterResponseParser):
     COMMAND_NUMBER = CommandNumber.GetFloorParams
+    OBJECT_ID_LENGTH = 2
     SHOULD_WRITE = False
+    __slots__ = ("floor_id", "floor_name", "floor_data")
 
     def __init__(self, raw_data:bytes, send_callback):
-        int_data = int.from_bytes(raw_data, byteorder='big')
-        super().__init__(response=int_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
+        super().__init__(response_bytes=raw_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
         self.floor_id = None
         self.floor_name = None
         self.floor_data = None
 
     async def parse_response(self):
-        raw_data = await self.parse_raw()
-        self.floor_id = await self._byte_list_to_hex(raw_data[:2])
-        name_len = raw_data[2]
-        name_data = raw_data[3:]
-        self.floor_name = await self.byte_list_to_string(name_data)
+        raw_data = self.parse_raw()
+        self.floor_id, name_len = _FLOOR_PARAMS_HEADER.unpack_from(raw_data)
+        name_data = raw_data[_FLOOR_PARAMS_HEADER.size:]
+        self.floor_name = self.byte_list_to_string(name_data)
         self.validate_data(self.floor_name, name_len)
         result = [FloorModel(id=self.floor_id, name=self.floor_name)]
         # Queue next floor params request if any pending
@@ -54,5 +54,5 @@ class FloorParamsParser(BaseParameterResponseParser):
         return result
     
     def validate_data(self, name, name_len):
-        if not name_len / 2 == len(name):
+        if not name_len == 2 * len(name):
             raise ValueError("Name length mismatch")
\ No newline at end of file
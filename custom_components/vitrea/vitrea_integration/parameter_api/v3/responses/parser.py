@@ -12,14 +12,14 @@ class DBResponseParserFactory:
     """
 
     PARSERS = [FloorNumbersParser, FloorParamsParser, RoomNumbersParser, RoomParamsParser, KeypadNumbersParser, KeyParamsParser, ACNumbersParser, ACParamsParser, ScenarioNumbersParser, ScenarioParamsParser]
+    PARSERS_BY_COMMAND = {parser.COMMAND_NUMBER.value: parser for parser in PARSERS}
 
     @classmethod
     def create_parser(cls, raw_data:bytes, send_callback:Callable) -> BaseParameterResponseParser:
         """
         Creates a parser based on the command number.
         """
-        command_number = int(raw_data.hex()[8:10], base=16)
-        for parser in cls.PARSERS:
-            if parser.COMMAND_NUMBER.value == command_number:
-                return parser(raw_data, send_callback)
-        return None
\ No newline at end of file
+        parser = cls.PARSERS_BY_COMMAND.get(raw_data[4])
+        if parser is None:
+            return None
+        return parser(raw_data, send_callback)
\ No newline at end of file
@@ -1,29 +1,29 @@
 from ....utils.enums import CommandNumber
 from .base import BaseParameterResponseParser
-from ..commands.scenarios import GetScenarioParams
 from ....models.database import ScenarioModel
+import struct
+
+# Scenario params header: scenario ID, room ID, name length
+_SCENARIO_PARAMS_HEADER = struct.Struct(">HHB")
 
 class ScenarioNumbersParser(BaseParameterResponseParser):
     COMMAND_NUMBER = CommandNumber.GetSceneNumbers
     SHOULD_WRITE = True
+    __slots__ = ("number_of_scenarios", "scenarios_list")
     def __init__(self, raw_data:bytes, send_callback):
-        int_data = int.from_bytes(raw_data, byteorder='big')
-        super().__init__(response=int_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
+        super().__init__(response_bytes=raw_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
         self.number_of_scenarios = None
         self.scenarios_list = None
 
     async def parse_response(self):
-        processed_data = await self.parse_raw()
-        self.number_of_scenarios = processed_data.pop(0)
-        self.scenarios_list = await self.combine_bytes_to_words(processed_data)
+        processed_data = self.parse_raw()
+        self.number_of_scenarios = processed_data[0]
+        self.validate_records_length(processed_data[1:], self.number_of_scenarios, 2)
+        self.scenarios_list = self.combine_bytes_to_words(processed_data[1:])
         self.validate_data(self.number_of_scenarios, self.scenarios_list)
-        # Store remaining scenarios for sequential processing (excluding first, which we queue now)
-        if len(self.scenarios_list) > 1:
-            self.send_callback.store_pending_scenarios(self.scenarios_list[1:])
-        # Queue only the first scenario params request
-        if self.scenarios_list:
-            from ..commands.scenarios import GetScenarioParams
-            await self.send_callback(GetScenarioParams(self.scenarios_list[0]))
+        # Keep a window of scenario params requests in flight, each response queues the next
+        self.send_callback.store_pending_scenarios(self.scenarios_list)
+        await self.send_callback.queue_next_scenario(count=self.send_callback.window)
         return {"no_of_scenarios": self.number_of_scenarios}
     
     def validate_data(self, number_of_scenarios, scenarios_list):
@@ -32,22 +32,21 @@ class ScenarioNumbersParser(BaseParameterResponseParser):
 
 class ScenarioParamsParser(BaseParameterResponseParser):
     COMMAND_NUMBER = CommandNumber.GetSceneParams
+    OBJECT_ID_LENGTH = 2
     SHOULD_WRITE = False
+    __slots__ = ("scenario_id", "room_id", "scenario_data")
 
     def __init__(self, raw_data:bytes, send_callback):
-        int_data = int.from_bytes(raw_data, byteorder='big')
-        super().__init__(response=int_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
+        super().__init__(response_bytes=raw_data, command_number=self.COMMAND_NUMBER, send_callback=send_callback)
         self.scenario_id = None
         self.room_id = None
         self.scenario_data = None
 
     async def parse_response(self):
-        processed_data = await self.parse_raw()
-        scenario_id = await self._byte_list_to_hex(processed_data[:2])
-        room_id = await self._byte_list_to_hex(processed_data[2:4])
-        name_len = processed_data[4]
-        name_data = processed_data[5:]
-        scenario_name = await self.byte_list_to_string(name_data)
+        processed_data = self.parse_raw()
+        scenario_id, room_id, name_len = _SCENARIO_PARAMS_HEADER.unpack_from(processed_data)
+        name_data = processed_data[_SCENARIO_PARAMS_HEADER.size:]
+        scenario_name = self.byte_list_to_string(name_data)
         self.validate_data(scenario_name, name_len)
         result = [ScenarioModel(id=scenario_id, name=scenario_name, room_id=room_id)]
         # Queue next scenario params request if any pending
@@ -55,6 +54,6 @@ class ScenarioParamsParser(BaseParameterResponseParser):
         return result
     
     def validate_data(self, name, name_len):
-        if not name_len / 2 == len(name):
+        if not name_len == 2 * len(name):
             raise ValueError("Name length mismatch")
         
\ No newline at end of file
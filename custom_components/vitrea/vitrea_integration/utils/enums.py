@@ -1,6 +1,6 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
-class KeyTypes(Enum):
+class KeyTypes(IntEnum):
     NotUsed = 0
     Toggle = 1
     PushButton = 2
@@ -27,7 +27,10 @@ class KeyTypes(Enum):
     AC_TYPE_3 = 23
     AC_TYPE_TMSF = 24
 
-class CommandNumber(Enum):
+# Key type member for each raw value, for the params parsers' per-key lookup
+KEY_TYPE_BY_VALUE = {member.value: member for member in KeyTypes}
+
+class CommandNumber(IntEnum):
     GetFloorNumbers = 1
     GetFloorParams = 2
     GetRoomNumbers = 3
@@ -39,13 +42,16 @@ class CommandNumber(Enum):
     GetSceneNumbers = 9
     GetSceneParams = 10
 
-class AirConditionerType(Enum):
+class AirConditionerType(IntEnum):
     TYPE_1 = 1
     TYPE_2 = 2
     TYPE_3 = 3
     TMSF = 4
 
-class ThermostatModes(Enum):
+# AC type member for each raw value, for the params parsers' per-AC lookup
+AIR_CONDITIONER_TYPE_BY_VALUE = {member.value: member for member in AirConditionerType}
+
+class ThermostatModes(IntEnum):
     COOL = 0
     HEAT = 1
     FAN = 2
@@ -54,7 +60,7 @@ class ThermostatModes(Enum):
     NA = -1
 
 
-class ThermostatFanSpeeds(Enum):
+class ThermostatFanSpeeds(IntEnum):
     LOW = 0
     MEDIUM = 1
     HIGH = 2
@@ -63,7 +69,7 @@ class ThermostatFanSpeeds(Enum):
     NA = -1
 
 
-class ThermostatTemperatureModes(Enum):
+class ThermostatTemperatureModes(IntEnum):
     CELSIUS = 0
     FAHRENHEIT = 1
     NA = -1
@@ -1,11 +1,21 @@
 # TODO - Get Controllers on network.
-import socket
-import struct
-import binascii
+import asyncio
+import logging
+import time
 import netifaces
 
+_LOGGER = logging.getLogger(__name__)
+
+
+# Interface addresses rarely change, so discovery reuses them for a while
+_IFACE_CACHE_TTL = 30
+_IFACE_CACHE = {"ts": 0.0, "val": None}
+
 
 def get_interface_addresses():
+    now = time.monotonic()
+    if _IFACE_CACHE["val"] is not None and now - _IFACE_CACHE["ts"] < _IFACE_CACHE_TTL:
+        return _IFACE_CACHE["val"]
     interface_addresses = []
     interfaces = netifaces.interfaces()
     for interface in interfaces:
@@ -14,45 +24,75 @@ def get_interface_addresses():
             for link in addrs[netifaces.AF_INET]:
                 if "addr" in link and "broadcast" in link:
                     interface_addresses.append((link["addr"], link["broadcast"]))
+    _IFACE_CACHE["ts"] = now
+    _IFACE_CACHE["val"] = interface_addresses
     return interface_addresses
 
 
-def discover_vitrea_devices(message):
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Collect the address of every controller answering a discovery broadcast."""
+
+    def __init__(self, local_addr, result):
+        self.local_addr = local_addr
+        self.result = result
+
+    def datagram_received(self, data, addr):
+        # Skip the hex dump unless it will actually be logged
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Response from %s: %s", addr, data.hex())
+        self.result.append(addr)
+
+    def error_received(self, exc):
+        _LOGGER.error("Error on interface %s: %s", self.local_addr, exc)
+
+
+async def discover_vitrea_devices(message):
     UDP_PORT = 11505
+    loop = asyncio.get_running_loop()
     interface_addresses = get_interface_addresses()
     result = []
+    transports = []
+    # Broadcast on every interface at once and collect answers for a single timeout window
     for local_addr, broadcast_addr in interface_addresses:
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.settimeout(5)
-            sock.bind((local_addr, 0))
-            sock.sendto(message.encode(), (broadcast_addr, UDP_PORT))
-
-            while True:
-                try:
-                    data, addr = sock.recvfrom(1024)
-                    print(f"Response from {addr}: {data.hex()}")
-                    result.append(addr)
-                except socket.timeout:
-                    break
-
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda local_addr=local_addr: _DiscoveryProtocol(local_addr, result),
+                local_addr=(local_addr, 0),
+                allow_broadcast=True,
+            )
+            transports.append(transport)
+            transport.sendto(message.encode(), (broadcast_addr, UDP_PORT))
         except Exception as e:
-            print(f"Error on interface {local_addr}: {e}")
-        finally:
-            sock.close()
+            _LOGGER.error("Error on interface %s: %s", local_addr, e)
+    try:
+        if transports:
+            await asyncio.sleep(5)
+    finally:
+        for transport in transports:
+            transport.close()
     return result
 
+
+# Lookup tables for the brightness scales, built once with the original
+# float mapping; index 0 is unused since both scales start at 1.
+# Map from 1-255 scale to 1-100 scale
+# Subtract 1 from the value and the range start to start from 0, scale, then add 1 to return to 1-100 range
+_SCALE_TO_100 = bytes(
+    [1] + [int(((value - 1) / (255 - 1)) * (100 - 1) + 1) for value in range(1, 256)]
+)
+# Map from 1-100 scale back to 1-255 scale
+_SCALE_TO_255 = bytes(
+    [1] + [int(((value - 1) / (100 - 1)) * (255 - 1) + 1) for value in range(1, 101)]
+)
+
+
 def scale_to_100(value: int) -> int:
     # Ensure the value is within the expected range
     if value < 1:
         value = 1
     elif value > 255:
         value = 255
-
-    # Map from 1-255 scale to 1-100 scale
-    # Subtract 1 from the value and the range start to start from 0, scale, then add 1 to return to 1-100 range
-    return int(((value - 1) / (255 - 1)) * (100 - 1) + 1)
+    return _SCALE_TO_100[value]
 
 
 def scale_to_255(value: int) -> int:
@@ -61,9 +101,7 @@ def scale_to_255(value: int) -> int:
         value = 1
     elif value > 100:
         value = 100
-
-    # Map from 1-100 scale back to 1-255 scale
-    return int(((value - 1) / (100 - 1)) * (255 - 1) + 1)
+    return _SCALE_TO_255[value]
 
 
 # Example usage
@@ -71,4 +109,5 @@ def scale_to_255(value: int) -> int:
 # Repeat for other messages as needed
 
 if __name__ == "__main__":
-    discover_vitrea_devices("VITREA-APP")
+    logging.basicConfig(level=logging.DEBUG)
+    asyncio.run(discover_vitrea_devices("VITREA-APP"))
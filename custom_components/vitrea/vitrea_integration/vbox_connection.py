@@ -1,15 +1,21 @@
 import asyncio
 import contextlib
 import logging
-import threading
+import socket
+import time
 from collections.abc import Awaitable, Callable
-from datetime import datetime, timedelta
 from typing import Any
 
 from .control_api.commands import AuthenticateCommand
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bounds on the commands coalesced into a single write/drain
+MAX_BATCH_COMMANDS = 64
+MAX_BATCH_BYTES = 64 * 1024
+# Unacknowledged data older than this drops the connection at the TCP level (Linux only)
+TCP_USER_TIMEOUT_MS = 20000
+
 
 def _create_task(awaitable: Awaitable[Any], *, name: str) -> asyncio.Task:
     """Create background tasks with a common exception handler."""
@@ -38,6 +44,8 @@ class VBoxConnection:
         connection_callback: Callable | None = None,
         event_beat_seconds: int = 0.2,
         enabled=True,
+        max_batch_commands: int = MAX_BATCH_COMMANDS,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
     ) -> None:
         self.ip = ip
         self.port = port
@@ -45,6 +53,8 @@ class VBoxConnection:
         self.writer = None
         self.command_queue: asyncio.Queue[bytes] = asyncio.Queue()
         self.event_beat_seconds = event_beat_seconds
+        self.max_batch_commands = max_batch_commands
+        self.max_batch_bytes = max_batch_bytes
         self._connected = False
         self._last_keep_alive = None
         self.response_callback = response_callback
@@ -52,9 +62,7 @@ class VBoxConnection:
         self.enabled = enabled
         self.error_reason = "Unknown Error"
         self.last_keep_alive_sent = None
-        self._connected_lock = threading.Lock()
-        self._task_lock = threading.Lock()
-        # Timestamps and diagnostics
+        # Timestamps and diagnostics, in time.monotonic() seconds
         self.last_rx = None
         self.last_tx = None
         # Reconnect coordination
@@ -72,8 +80,7 @@ class VBoxConnection:
     @property
     def connected(self):
         """Return the connection status of the VBox."""
-        with self._connected_lock:
-            return self._connected
+        return self._connected
 
     @property
     def last_keep_alive(self):
@@ -87,12 +94,9 @@ class VBoxConnection:
 
     async def set_connected(self, value):
         """Set the connected property and notify on transitions."""
-        changed = False
-        with self._connected_lock:
-            if self._connected != value:
-                self._connected = value
-                changed = True
-        if changed:
+        # Runs on the event loop and does not await before the assignment, so no lock is needed
+        if self._connected != value:
+            self._connected = value
             # Once-only availability logging
             if value:
                 if self._unavailable_logged:
@@ -206,7 +210,7 @@ class VBoxConnection:
             return False
         if not isinstance(command, bytes):
             raise TypeError("Command must be bytes, received str:", command)
-        await self.command_queue.put(command)
+        self.command_queue.put_nowait(command)
         return True
 
     async def receive(self):
@@ -235,9 +239,12 @@ class VBoxConnection:
 
         for attempt in range(1, 4):
             try:
-                self.reader, self.writer = await asyncio.wait_for(
-                    asyncio.open_connection(self.ip, self.port), timeout=3
-                )
+                sock = await self._connect_socket()
+                try:
+                    self.reader, self.writer = await asyncio.open_connection(sock=sock)
+                except BaseException:
+                    sock.close()
+                    raise
                 _LOGGER.info("Connected to VBox")
                 await self.set_connected(True)
                 self.last_keep_alive = None
@@ -256,44 +263,81 @@ class VBoxConnection:
 
         raise ConnectionError(f"Failed to connect to VBox at {self.ip}:{self.port}")
 
+    async def _connect_socket(self) -> socket.socket:
+        """Connect a socket to the first resolved address of the controller that accepts."""
+
+        loop = asyncio.get_running_loop()
+        # Resolve first so an IPv6 address or a host name gets a socket of the matching family
+        addr_infos = await loop.getaddrinfo(
+            self.ip, self.port, type=socket.SOCK_STREAM
+        )
+        last_exc: OSError | None = None
+        for family, _, _, _, sockaddr in addr_infos:
+            sock = self._create_socket(family)
+            try:
+                await asyncio.wait_for(loop.sock_connect(sock, sockaddr), timeout=3)
+            except OSError as exc:
+                sock.close()
+                last_exc = exc
+                continue
+            except BaseException:
+                sock.close()
+                raise
+            return sock
+        raise last_exc
+
+    @staticmethod
+    def _create_socket(family: int) -> socket.socket:
+        """Create a non-blocking TCP socket configured before the handshake."""
+
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Commands are small and latency sensitive, don't let Nagle hold them back
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            sock.setsockopt(
+                socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, TCP_USER_TIMEOUT_MS
+            )
+        return sock
+
     async def _send_keep_alive(self) -> None:
         """Send a keep-alive command."""
 
         if not self.writer:
             return
         await self._send(AuthenticateCommand().serialize())
-        self.last_keep_alive_sent = datetime.now()
+        self.last_keep_alive_sent = time.monotonic()
 
     def _ensure_background_tasks(self) -> None:
         """Spawn the reader/writer/monitor tasks exactly once."""
 
-        with self._task_lock:
-            if self._reader_task is None or self._reader_task.done():
-                self._reader_task = _create_task(
-                    self._reader_loop(), name="vitrea-reader"
-                )
-                self._reader_task.add_done_callback(
-                    lambda task: self._tasks.discard(task)
-                )
-                self._tasks.add(self._reader_task)
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = _create_task(
+                self._reader_loop(), name="vitrea-reader"
+            )
+            self._reader_task.add_done_callback(
+                lambda task: self._tasks.discard(task)
+            )
+            self._tasks.add(self._reader_task)
 
-            if self._writer_task is None or self._writer_task.done():
-                self._writer_task = _create_task(
-                    self._writer_loop(), name="vitrea-writer"
-                )
-                self._writer_task.add_done_callback(
-                    lambda task: self._tasks.discard(task)
-                )
-                self._tasks.add(self._writer_task)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = _create_task(
+                self._writer_loop(), name="vitrea-writer"
+            )
+            self._writer_task.add_done_callback(
+                lambda task: self._tasks.discard(task)
+            )
+            self._tasks.add(self._writer_task)
 
-            if self._monitor_task is None or self._monitor_task.done():
-                self._monitor_task = _create_task(
-                    self._monitor_loop(), name="vitrea-monitor"
-                )
-                self._monitor_task.add_done_callback(
-                    lambda task: self._tasks.discard(task)
-                )
-                self._tasks.add(self._monitor_task)
+        if self._monitor_task is None or self._monitor_task.done():
+            self._monitor_task = _create_task(
+                self._monitor_loop(), name="vitrea-monitor"
+            )
+            self._monitor_task.add_done_callback(
+                lambda task: self._tasks.discard(task)
+            )
+            self._tasks.add(self._monitor_task)
 
     def _tasks_running(self) -> bool:
         return any(task for task in self._tasks if not task.done())
@@ -310,14 +354,16 @@ class VBoxConnection:
                 await asyncio.sleep(self.event_beat_seconds)
                 continue
 
-            self.last_rx = datetime.now()
+            self.last_rx = time.monotonic()
             if response.startswith((b"VTH>", b"H:")):
                 _LOGGER.debug("Dropping echo frame: %s", response)
                 continue
 
-            _LOGGER.debug(
-                "Received response from VBox: %s (hex: %s)", response, response.hex()
-            )
+            # Skip the hex dump unless it will actually be logged
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Received response from VBox: %s (hex: %s)", response, response.hex()
+                )
             try:
                 await self.response_callback(response)
             except Exception as err:  # noqa: BLE001
@@ -328,18 +374,46 @@ class VBoxConnection:
     async def _writer_loop(self) -> None:
         """Continuously send queued commands to the controller."""
 
-        while self.enabled and not self._stop_event.is_set():
-            try:
-                command = await asyncio.wait_for(
-                    self.command_queue.get(), timeout=self.event_beat_seconds
+        # Park until a command is queued or the connection is stopped, rather than polling the queue
+        stop_task = asyncio.create_task(self._stop_event.wait())
+        get_task: asyncio.Task | None = None
+        try:
+            while self.enabled and not self._stop_event.is_set():
+                get_task = asyncio.create_task(self.command_queue.get())
+                await asyncio.wait(
+                    {get_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
                 )
-            except asyncio.TimeoutError:
-                command = None
-
-            if not command:
-                continue
-            await self._send(command)
-            continue 
+                if not get_task.done():
+                    break
+                command = get_task.result()
+                get_task = None
+
+                # Flush what is queued behind this command in one write/drain, up to the batch limits
+                frames = [command]
+                batch_bytes = len(command)
+                while (
+                    not self.command_queue.empty()
+                    and len(frames) < self.max_batch_commands
+                    and batch_bytes < self.max_batch_bytes
+                ):
+                    frame = self.command_queue.get_nowait()
+                    frames.append(frame)
+                    batch_bytes += len(frame)
+                await self._send(b"".join(frames))
+        finally:
+            # Cancel and await the helper tasks so none outlive the loop
+            pending = [task for task in (get_task, stop_task) if task and not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            # A command taken off the queue but never sent goes back for the next writer loop
+            if (
+                get_task is not None
+                and get_task.done()
+                and not get_task.cancelled()
+                and get_task.exception() is None
+            ):
+                self.command_queue.put_nowait(get_task.result())
 
         _LOGGER.debug("Writer loop finished")
 
@@ -347,10 +421,10 @@ class VBoxConnection:
         """Monitor connection state and trigger keep-alives/timeouts."""
 
         while self.enabled and not self._stop_event.is_set():
-            now = datetime.now()
+            now = time.monotonic()
             if (
                 self.last_keep_alive_sent is None
-                or (now - self.last_keep_alive_sent) > timedelta(seconds=20)
+                or now - self.last_keep_alive_sent > 20
             ):
                 try:
                     await self._send_keep_alive()
@@ -360,7 +434,7 @@ class VBoxConnection:
                     await self._handle_connection_failure()
                     return
 
-            if self.last_rx and (now - self.last_rx) > timedelta(seconds=45):
+            if self.last_rx is not None and now - self.last_rx > 45:
                 _LOGGER.error(
                     "No keep alive response received for more than 45 seconds"
                 )
@@ -374,13 +448,14 @@ class VBoxConnection:
 
     async def _send(self, command: bytes) -> bool:
         """Send a command to the VBox."""
-        _LOGGER.debug(("sending(ascii):", command))
-        _LOGGER.debug(("sending(hex):", command.hex()))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("sending(ascii): %s", command)
+            _LOGGER.debug("sending(hex): %s", command.hex())
         if not self.writer:
             raise ConnectionError("Connection is not available")
         self.writer.write(command)
         await self.writer.drain()
-        self.last_tx = datetime.now()
+        self.last_tx = time.monotonic()
         _LOGGER.debug("Command sent to VBox")
         return True
 
@@ -390,22 +465,24 @@ class VBoxConnection:
             await self.set_connected(False)
             self.error_reason = "Connection Lost"
             return None
-        prefix = await self.reader.read(2)
-        # prefix should be b'VT' and we should remove the newline before combining with data.
-        if prefix != b"VT":
-            result = await self.reader.readuntil(b"\r\n")
-            result = prefix + result
-        else:
-            info = await self.reader.read(5)
-            # len is 2 bytes at the end of the info
-            length = int(info[-2:].hex()[1:], 16)
-            result = await self.reader.read(length)
-            result = prefix + info + result
+        try:
+            prefix = await self.reader.readexactly(2)
+            # prefix should be b'VT' and we should remove the newline before combining with data.
+            if prefix != b"VT":
+                result = prefix + await self.reader.readuntil(b"\r\n")
+            else:
+                info = await self.reader.readexactly(5)
+                # len is the low 12 bits of the 2 bytes at the end of the info
+                length = ((info[3] & 0x0F) << 8) | info[4]
+                result = b"".join((prefix, info, await self.reader.readexactly(length)))
+        except asyncio.IncompleteReadError:
+            # The controller closed the connection, possibly mid-frame
+            result = b""
         if not result:
             self.error_reason = "Connection Closed By Controller"
             await self.set_connected(False)
-        if result:
-            _LOGGER.debug(("RECEIVED: ", result.hex()))
+        if result and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("RECEIVED: %s", result.hex())
         return result
 
     async def __aexit__(self, exc_type, exc, tb):
@@ -429,21 +506,19 @@ class VBoxConnection:
             self.enabled = False
 
         self._stop_event.set()
-        with self._task_lock:
-            current = asyncio.current_task()
-            for task in list(self._tasks):
-                if task is current:
-                    continue
-                task.cancel()
-            for task in list(self._tasks):
-                if task is current:
-                    continue
-                with contextlib.suppress(asyncio.CancelledError):
-                    await task
-            self._tasks.clear()
-            self._reader_task = None
-            self._writer_task = None
-            self._monitor_task = None
+        # Cancel every background task but the caller (the reconnect task tears down too),
+        # and wait for all of them together so none is left half-cancelled
+        current = asyncio.current_task()
+        to_cancel = [task for task in self._tasks if task is not current]
+        for task in to_cancel:
+            task.cancel()
+        # Failures are already logged by the _create_task done callback
+        await asyncio.gather(*to_cancel, return_exceptions=True)
+        # Keep the caller referenced, it discards itself when it finishes
+        self._tasks.difference_update(to_cancel)
+        self._reader_task = None
+        self._writer_task = None
+        self._monitor_task = None
 
         await self._close_writer()
 
@@ -469,7 +544,7 @@ class VBoxConnection:
 
         if not self.connected:
             return False
-        if self.last_rx and datetime.now() - self.last_rx > timedelta(seconds=45):
+        if self.last_rx is not None and time.monotonic() - self.last_rx > 45:
             return False
         for task in (self._reader_task, self._writer_task, self._monitor_task):
             if task and task.done():